@@ -3,7 +3,8 @@ SmartHire - AI-Powered Recruitment Assistant
 Main Streamlit Application
 """
 import streamlit as st
-import json
+import orjson
+import queue
 import sys
 from pathlib import Path
 
@@ -14,36 +15,29 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Import components
 from components import load_css, display_sections, render_sidebar, render_hero
-from components.helpers import get_dataset_stats, process_single_resume, get_directories
-from components.ui import render_section_header, render_upload_area, render_info_card, render_stat_card, render_pipeline_card
-
-# Import pipeline functions
-from pdf_extractor import process_all_pdfs
-from section_resumes import process_all_txt as section_all_resumes
+from components.helpers import (
+    get_dataset_stats, analyze_resume, get_directories,
+    get_sectioned_index, search_sectioned_files, load_candidate_files, build_candidates_zip,
+    modules_available, load_extractor_module, load_sectioning_module,
+    load_vector_store_module, load_export_module, load_query_module, load_matching_module,
+    get_vector_store, reset_vector_store, run_pipeline_in_background, content_hash
+)
+from components.ui import render_section_header, render_upload_area, render_info_card, render_stat_card, render_pipeline_card, render_score_bar
 
-# Extra utilities (embeddings / export)
-from scripts.build_vector_store import build_vector_store
-from scripts.export_chroma import export_chroma_csv
+# Pipeline / embeddings / export / query / matching modules are loaded lazily
+# (see components.helpers) so the first page render doesn't wait on them
 
-# Import query functions (Week 7 - AI Engineer)
-try:
-    from query_resumes import answer_question, search_resumes
-    QUERY_AVAILABLE = True
-except Exception:
-    QUERY_AVAILABLE = False
+# Query functions (Week 7 - AI Engineer)
+QUERY_AVAILABLE = modules_available("query_resumes", "openai", "langchain_community", "langchain_huggingface")
 
-# Import matching functions (Week 8)
-try:
-    from match_resumes import match_top_candidates
-    MATCHING_AVAILABLE = True
-except Exception:
-    MATCHING_AVAILABLE = False
+# Matching functions (Week 8)
+MATCHING_AVAILABLE = modules_available("match_resumes", "openai", "numpy")
 
 # Get directories
 dirs = get_directories()
 
 # Ensure directories exist
-for dir_path in [dirs["raw"], dirs["text"], dirs["sectioned"], dirs["uploads"]]:
+for dir_path in [dirs["raw"], dirs["text"], dirs["sectioned"]]:
     dir_path.mkdir(parents=True, exist_ok=True)
 
 
@@ -90,10 +84,8 @@ with tab1:
         render_info_card()
     
     if uploaded_file is not None:
-        # Save uploaded file
-        save_path = dirs["uploads"] / uploaded_file.name
-        with open(save_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # The upload is analyzed straight from memory - nothing is written to disk
+        upload_stem = Path(uploaded_file.name).stem
         
         st.success(f"✅ **{uploaded_file.name}** uploaded successfully!")
         
@@ -110,10 +102,17 @@ with tab1:
         with col2:
             analyze_btn = st.button("🚀 Analyze Resume with AI", type="primary", use_container_width=True)
         
+        # Keep the last result in session state so toggling the options above
+        # re-renders it instead of dropping it until the next Analyze click
+        pdf_bytes = uploaded_file.getvalue()
+        upload_hash = content_hash(pdf_bytes)
+        
         if analyze_btn:
             with st.spinner("🤖 AI is analyzing the resume..."):
-                result = process_single_resume(save_path)
-            
+                st.session_state.analysis = (upload_hash, analyze_resume(pdf_bytes, uploaded_file.name))
+        
+        analysis_hash, result = st.session_state.get("analysis", (None, None))
+        if analysis_hash == upload_hash:
             if "error" in result:
                 st.error(f"❌ {result['error']}")
             else:
@@ -128,18 +127,27 @@ with tab1:
                     with st.expander("🧹 Cleaned Text"):
                         st.text_area("Cleaned Text", result["clean_text"], height=200, label_visibility="collapsed")
                 
-                # Download button
+                # Download buttons (the raw text is only sent when clicked, unlike
+                # the text areas above which are only rendered when enabled)
                 st.divider()
-                col1, col2, col3 = st.columns([1, 2, 1])
-                with col2:
-                    json_output = json.dumps(result["sections"], indent=2, ensure_ascii=False)
+                col1, col2 = st.columns(2)
+                with col1:
+                    json_output = orjson.dumps(result["sections"], option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
                     st.download_button(
                         label="📥 Download JSON",
                         data=json_output,
-                        file_name=f"{save_path.stem}_structured.json",
+                        file_name=f"{upload_stem}_structured.json",
                         mime="application/json",
                         use_container_width=True
                     )
+                with col2:
+                    st.download_button(
+                        label="📄 Download Raw Text",
+                        data=result["raw_text"].encode("utf-8"),
+                        file_name=f"{upload_stem}.txt",
+                        mime="text/plain",
+                        use_container_width=True
+                    )
 
 
 # ============================================
@@ -159,15 +167,19 @@ with tab2:
     
     st.markdown("<br>", unsafe_allow_html=True)
     
+    # A background pipeline run is writing these files; don't start another step over them
+    pipeline_running = "pipeline_future" in st.session_state
+    
     # Pipeline steps
     col1, col2 = st.columns(2)
     
     with col1:
-        render_pipeline_card("📄 Step 1: Extract Text", "Convert PDF files to plain text using pdfplumber")
-        if st.button("▶️ Run Extraction", key="extract", use_container_width=True):
+        render_pipeline_card("📄 Step 1: Extract Text", "Convert PDF files to plain text using PyMuPDF")
+        if st.button("▶️ Run Extraction", key="extract", use_container_width=True, disabled=pipeline_running):
             with st.spinner("📄 Extracting text from PDFs..."):
+                extract_progress = st.progress(0)
                 try:
-                    process_all_pdfs()
+                    load_extractor_module().process_all_pdfs(progress_callback=lambda current, total: extract_progress.progress(current / total))
                     st.success("✅ PDF extraction complete!")
                     st.rerun()
                 except Exception as e:
@@ -175,10 +187,11 @@ with tab2:
     
     with col2:
         render_pipeline_card("🤖 Step 2: AI Structuring", "Use LLM to extract structured resume data")
-        if st.button("🤖 Run AI Processing", key="section", use_container_width=True):
+        if st.button("🤖 Run AI Processing", key="section", use_container_width=True, disabled=pipeline_running):
             with st.spinner("🤖 Processing with AI (this may take a while)..."):
+                section_progress = st.progress(0)
                 try:
-                    section_all_resumes()
+                    load_sectioning_module().process_all_txt(progress_callback=lambda current, total: section_progress.progress(current / total))
                     st.success("✅ AI processing complete!")
                     st.rerun()
                 except Exception as e:
@@ -189,28 +202,56 @@ with tab2:
     # Full pipeline
     render_pipeline_card("🚀 Run Complete Pipeline", "Execute all 3 steps: Extract → Structure → Embed", highlight=True)
     
-    if st.button("🚀 Run Full Pipeline", type="primary", use_container_width=True):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+    if st.button("🚀 Run Full Pipeline", type="primary", use_container_width=True, disabled=pipeline_running):
+        # Run in the background so the rest of the app stays responsive
+        st.session_state.pipeline_progress = queue.Queue()
+        st.session_state.pipeline_status = (0, 3, "📄 Step 1/3: Extracting text from PDFs...")
+        st.session_state.pipeline_future = run_pipeline_in_background(
+            [
+                ("📄 Step 1/3: Extracting text from PDFs...", load_extractor_module().process_all_pdfs),
+                ("🤖 Step 2/3: Processing with AI...", load_sectioning_module().process_all_txt),
+                ("🧠 Step 3/3: Building embeddings...", load_vector_store_module().build_vector_store),
+            ],
+            st.session_state.pipeline_progress
+        )
+        # Rerun so the step buttons above are shown disabled right away
+        st.rerun()
+    
+    @st.fragment(run_every=1)
+    def render_pipeline_status():
+        """Poll the background pipeline and show its progress"""
+        future = st.session_state.pipeline_future
+        progress = st.session_state.pipeline_progress
         
-        try:
-            status_text.info("📄 Step 1/3: Extracting text from PDFs...")
-            process_all_pdfs()
-            progress_bar.progress(33)
-            
-            status_text.info("🤖 Step 2/3: Processing with AI...")
-            section_all_resumes()
-            progress_bar.progress(66)
-            
-            status_text.info("🧠 Step 3/3: Building embeddings...")
-            build_vector_store()
-            progress_bar.progress(100)
-            
-            status_text.success("✅ Pipeline complete! AI Search is ready.")
+        while not progress.empty():
+            st.session_state.pipeline_status = progress.get_nowait()
+        current, total, label = st.session_state.pipeline_status
+        
+        if not future.done():
+            st.progress(current / total)
+            st.info(label)
+            return
+        
+        del st.session_state.pipeline_future
+        error = future.exception()
+        if error is not None:
+            st.session_state.pipeline_result = ("error", f"❌ Pipeline error: {error}")
+        else:
+            reset_vector_store()
+            st.session_state.pipeline_result = ("success", "✅ Pipeline complete! AI Search is ready.")
+        
+        # Full rerun so stats and candidate lists pick up the new files
+        st.rerun()
+    
+    if pipeline_running:
+        render_pipeline_status()
+    elif "pipeline_result" in st.session_state:
+        status, message = st.session_state.pop("pipeline_result")
+        if status == "success":
+            st.success(message)
             st.balloons()
-            st.rerun()
-        except Exception as e:
-            st.error(f"❌ Pipeline error: {e}")
+        else:
+            st.error(message)
 
     # -------------------------------
     # Step 3: Build Embeddings for AI Search
@@ -218,10 +259,11 @@ with tab2:
     st.markdown("<br>", unsafe_allow_html=True)
     render_pipeline_card("🧠 Step 3: Build Embeddings", "Create vector embeddings for AI-powered search (required for AI Search tab)")
     
-    if st.button("🧠 Build Embeddings", key="build_embeddings", use_container_width=True):
+    if st.button("🧠 Build Embeddings", key="build_embeddings", use_container_width=True, disabled=pipeline_running):
         with st.spinner("🧠 Building embeddings (this may take a minute)..."):
             try:
-                build_vector_store()
+                load_vector_store_module().build_vector_store()
+                reset_vector_store()
                 st.success("✅ Embeddings built! AI Search is now ready.")
                 st.rerun()
             except Exception as e:
@@ -233,10 +275,10 @@ with tab2:
     st.markdown("<br>", unsafe_allow_html=True)
     with st.expander("📤 Export Database to CSV"):
         include_emb = st.checkbox("Include embeddings in CSV (large file)", value=False)
-        if st.button("📤 Export to CSV", key="export_db", use_container_width=True):
+        if st.button("📤 Export to CSV", key="export_db", use_container_width=True, disabled=pipeline_running):
             with st.spinner("Exporting Chroma DB to CSV..."):
                 try:
-                    n = export_chroma_csv(include_embeddings=include_emb)
+                    n = load_export_module().export_chroma_csv(include_embeddings=include_emb)
                     st.success(f"✅ Exported {n} rows to data/chroma_export.csv")
                     with open("data/chroma_export.csv", "rb") as fh:
                         st.download_button("Download CSV", fh, file_name="chroma_export.csv")
@@ -250,7 +292,9 @@ with tab2:
 with tab3:
     render_section_header("👥 Candidate Database")
     
-    structured_files = list(dirs["sectioned"].glob("*.json"))
+    # One index lookup per rerun, shared by the count, the search and the list
+    sectioned_index = get_sectioned_index()
+    structured_files = sectioned_index[0]
     
     if not structured_files:
         st.markdown("""
@@ -281,13 +325,25 @@ with tab3:
         # Filter files by ID (searches ALL candidates)
         search_term = search_term.strip()  # Remove leading/trailing whitespace
         if search_term:
-            filtered_files = [f for f in structured_files if search_term.lower() in f.stem.lower()]
+            filtered_files = search_sectioned_files(sectioned_index, search_term)
             if filtered_files:
                 st.success(f"Found {len(filtered_files)} candidate(s) matching '{search_term}' (searching all {len(structured_files)} candidates)")
             else:
                 st.warning(f"No candidates found matching '{search_term}' in {len(structured_files)} candidates")
         else:
             filtered_files = structured_files
+        
+        # Bulk export - only built on request, not on every rerun
+        with st.expander(f"📦 Export {len(filtered_files)} candidate(s) as ZIP"):
+            if st.button("📦 Prepare ZIP", key="prepare_zip", use_container_width=True):
+                with st.spinner("Zipping candidate files..."):
+                    st.download_button(
+                        "📥 Download ZIP",
+                        build_candidates_zip(filtered_files),
+                        file_name="candidates.zip",
+                        mime="application/zip",
+                        use_container_width=True
+                    )
 
         # ---------------------------------
         # Quick skill-based search (uses hybrid keyword + semantic)
@@ -299,9 +355,8 @@ with tab3:
         if ai_query and st.button("🔍 Search Skills", key="ai_search"):
             if QUERY_AVAILABLE:
                 try:
-                    from query_resumes import search_resumes
                     with st.spinner("Searching candidates..."):
-                        results = search_resumes(ai_query, n_results=ai_k)
+                        results = load_query_module().search_resumes(ai_query, n_results=ai_k, db=get_vector_store())
                     
                     if not results:
                         st.info("No candidates found with those skills.")
@@ -325,52 +380,85 @@ with tab3:
             else:
                 st.warning("AI Search not available. Run the pipeline first.")
         
-        # Pagination
-        col1, col2, col3 = st.columns([1, 2, 1])
-        items_per_page = 5
-        total_pages = max(1, (len(filtered_files) + items_per_page - 1) // items_per_page)
-        
-        # Ensure page is within valid range
-        if st.session_state.browse_page > total_pages:
-            st.session_state.browse_page = 1
-        
-        with col2:
-            page = st.selectbox(
-                "Page", 
-                range(1, total_pages + 1), 
-                index=st.session_state.browse_page - 1,
-                key="browse_page_select",
-                label_visibility="collapsed"
-            )
-            st.session_state.browse_page = page
-        with col3:
-            st.caption(f"Page {page} of {total_pages}")
-        
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_files = filtered_files[start_idx:end_idx]
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Display candidates
-        for file in page_files:
-            try:
-                data = json.loads(file.read_text(encoding="utf-8"))
-                sections = data.get("sections", {})
+        # Candidate list runs as a fragment so paging only reruns this block
+        @st.fragment
+        def render_candidate_list(filtered_files: list, search_term: str):
+            # Pagination
+            col1, col2, col3 = st.columns([1, 2, 1])
+            items_per_page = 5
+            total_pages = max(1, (len(filtered_files) + items_per_page - 1) // items_per_page)
+            
+            # Ensure page is within valid range
+            if st.session_state.browse_page > total_pages:
+                st.session_state.browse_page = 1
+            
+            with col2:
+                page = st.selectbox(
+                    "Page", 
+                    range(1, total_pages + 1), 
+                    index=st.session_state.browse_page - 1,
+                    key="browse_page_select",
+                    label_visibility="collapsed"
+                )
+                st.session_state.browse_page = page
+            with col3:
+                st.caption(f"Page {page} of {total_pages}")
+            
+            start_idx = (page - 1) * items_per_page
+            end_idx = start_idx + items_per_page
+            page_files = filtered_files[start_idx:end_idx]
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Display candidates as a single table; full details for the selected row
+            candidates = []
+            for file, data, load_error in load_candidate_files(page_files):
+                if load_error is not None:
+                    st.error(f"Error loading {file.name}: {load_error}")
+                    continue
+                candidates.append((file, data.get("sections", {})))
+            
+            rows = []
+            for file, sections in candidates:
+                summary = str(sections.get("summary") or "N/A")
+                rows.append({
+                    "Candidate": file.stem,
+                    "Summary": summary if len(summary) <= 120 else summary[:120] + "...",
+                    "Skills": len(sections.get("skills") or [])
+                })
+            
+            if rows:
+                table = st.dataframe(
+                    rows,
+                    use_container_width=True,
+                    hide_index=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    # Selections are kept per key, so a new search starts with a fresh one
+                    key=f"candidate_table_{search_term}_{page}"
+                )
+                selected_rows = table.selection.rows
                 
-                with st.expander(f"👤 Candidate {file.stem}"):
-                    st.markdown(f"**📋 Summary:** {sections.get('summary', 'N/A')}")
-                    
-                    if sections.get("skills"):
-                        st.markdown("**🛠️ Skills:**")
-                        skills_display = " • ".join(sections.get("skills", []))
-                        st.markdown(f'<p style="color: #667eea;">{skills_display}</p>', unsafe_allow_html=True)
-                    
-                    st.divider()
-                    display_sections(sections)
-                    
-            except Exception as e:
-                st.error(f"Error loading {file.name}: {e}")
+                if not selected_rows or selected_rows[0] >= len(candidates):
+                    st.caption("Select a candidate to see their full profile.")
+                else:
+                    file, sections = candidates[selected_rows[0]]
+                    try:
+                        render_section_header(f"👤 Candidate {file.stem}")
+                        st.markdown(f"**📋 Summary:** {sections.get('summary', 'N/A')}")
+                        
+                        if sections.get("skills"):
+                            st.markdown("**🛠️ Skills:**")
+                            skills_display = " • ".join(sections.get("skills", []))
+                            st.markdown(f'<p style="color: #667eea;">{skills_display}</p>', unsafe_allow_html=True)
+                        
+                        st.divider()
+                        display_sections(sections)
+                        
+                    except Exception as e:
+                        st.error(f"Error loading {file.name}: {e}")
+        
+        render_candidate_list(filtered_files, search_term)
 
 
 # ============================================
@@ -416,7 +504,7 @@ with tab4:
         if search_btn and question:
             with st.spinner("🤖 AI is searching and analyzing resumes..."):
                 try:
-                    result = answer_question(question, n_results=num_results)
+                    result = load_query_module().answer_question(question, n_results=num_results, db=get_vector_store())
                     
                     # Display answer
                     render_section_header("📝 AI Answer")
@@ -520,10 +608,11 @@ Nice to have:
             
             with st.spinner("🤖 AI is analyzing candidates..."):
                 try:
-                    results = match_top_candidates(
+                    results = load_matching_module().match_top_candidates(
                         job_description.strip(),
                         n_candidates=n_candidates,
-                        progress_callback=update_progress
+                        progress_callback=update_progress,
+                        db=get_vector_store()
                     )
                     
                     progress_bar.progress(1.0)
@@ -553,11 +642,7 @@ Nice to have:
                             
                             with st.expander(f"#{i} Candidate {r['candidate_id']} — **{score}/100** {badge}", expanded=(i <= 3)):
                                 # Score bar
-                                st.markdown(f"""
-                                <div style="background: #e0e0e0; border-radius: 10px; height: 20px; margin-bottom: 1rem;">
-                                    <div style="background: {score_color}; width: {score}%; height: 100%; border-radius: 10px;"></div>
-                                </div>
-                                """, unsafe_allow_html=True)
+                                render_score_bar(score, score_color)
                                 
                                 # Summary
                                 st.markdown(f"**📋 Summary:** {r['summary']}")
@@ -592,7 +677,7 @@ Nice to have:
                         
                         # Download results
                         st.markdown("<br>", unsafe_allow_html=True)
-                        results_json = json.dumps(results, indent=2, ensure_ascii=False)
+                        results_json = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
                         st.download_button(
                             "📥 Download Results (JSON)",
                             results_json,
@@ -2,29 +2,62 @@
 SmartHire - Helper Functions
 Data processing and utility functions
 """
+import io
+import os
 import sys
+import queue
+import zipfile
+import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+import streamlit as st
+
 # Add scripts folder to path for imports
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 
-from pdf_extractor import extract_text_from_pdf as extract_pdf_pdfplumber
-from section_resumes import clean_text, section_with_llm
+from result_cache import content_hash, cache_get, cache_put
 
 # Directory paths
 DATA_DIR = PROJECT_ROOT / "data"
 RAW_DIR = DATA_DIR / "raw" / "fake_resumes"
 PROCESSED_TEXT_DIR = DATA_DIR / "processed" / "resumes_text"
 PROCESSED_SECTIONED_DIR = DATA_DIR / "processed" / "resumes_sectioned_json"
-UPLOADS_DIR = DATA_DIR / "uploads"
 
+# Written by the sectioning step (same path as section_resumes.MANIFEST_PATH)
+MANIFEST_PATH = DATA_DIR / "processed" / "resumes_sectioned_manifest.json"
 
-def get_dataset_stats() -> dict:
-    """Get statistics about the current dataset"""
-    raw_pdfs = list(RAW_DIR.glob("*.pdf"))
-    text_files = list(PROCESSED_TEXT_DIR.glob("*.txt"))
-    sectioned_files = list(PROCESSED_SECTIONED_DIR.glob("*.json"))
+
+def _dir_mtime(path: Path) -> int:
+    """Get a directory's mtime in nanoseconds (0 if it doesn't exist)"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _list_suffix(directory: Path, suffix: str) -> list:
+    """
+    List files in directory ending with suffix.
+    os.scandir reuses the directory entries' cached type info, so this is
+    cheaper than Path.glob's per-name pattern matching on large folders.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(e.path) for e in entries if e.name.endswith(suffix) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_dataset_stats(raw_mtime: int, text_mtime: int, sectioned_mtime: int) -> dict:
+    """Count dataset files (cached; the mtime args only act as the cache key)"""
+    raw_pdfs = _list_suffix(RAW_DIR, ".pdf")
+    text_files = _list_suffix(PROCESSED_TEXT_DIR, ".txt")
+    sectioned_files = _list_suffix(PROCESSED_SECTIONED_DIR, ".json")
     
     return {
         "raw_pdfs": len(raw_pdfs),
@@ -33,35 +66,255 @@ def get_dataset_stats() -> dict:
     }
 
 
-def process_single_resume(pdf_path: Path) -> dict:
+def get_dataset_stats() -> dict:
+    """Get statistics about the current dataset"""
+    # Directory mtimes change whenever a file is added or removed,
+    # so the cached counts are only recomputed after the pipeline writes
+    return _get_dataset_stats(
+        _dir_mtime(RAW_DIR),
+        _dir_mtime(PROCESSED_TEXT_DIR),
+        _dir_mtime(PROCESSED_SECTIONED_DIR)
+    )
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _list_sectioned_files(dir_str: str, mtime_ns: int) -> tuple:
+    """
+    List the sectioned JSON files (cached; mtime_ns only acts as the cache key).
+    Uses the pipeline's manifest when it is up to date, otherwise globs the directory.
+    Returns (file paths, lowercase stems) as parallel tuples of str - immutable, so
+    every rerun shares one copy instead of cache_data unpickling a fresh one.
+    """
+    files = None
+    try:
+        manifest = orjson.loads(MANIFEST_PATH.read_bytes())
+        if manifest.get("dir_mtime_ns") == mtime_ns:
+            files = tuple(os.path.join(dir_str, c["file"]) for c in manifest["candidates"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    if files is None:
+        files = tuple(str(f) for f in sorted(_list_suffix(Path(dir_str), ".json")))
+    
+    return files, tuple(os.path.splitext(os.path.basename(f))[0].lower() for f in files)
+
+
+def get_sectioned_index() -> tuple:
+    """
+    Get (file paths, lowercase stems) for all structured candidate JSON files,
+    re-scanned only when the directory changes. Fetch it once per rerun.
+    """
+    return _list_sectioned_files(str(PROCESSED_SECTIONED_DIR), _dir_mtime(PROCESSED_SECTIONED_DIR))
+
+
+def search_sectioned_files(index: tuple, search_term: str) -> list:
+    """Get the candidate files in index whose ID contains search_term (case-insensitive)"""
+    files, lowercase_stems = index
+    needle = search_term.lower()
+    
+    # Stems are lowercased once per directory change, not on every search
+    return [files[i] for i, stem in enumerate(lowercase_stems) if needle in stem]
+
+
+@st.cache_data(max_entries=2000, show_spinner=False)
+def load_candidate(path_str: str, mtime_ns: int) -> dict:
+    """Parse a candidate JSON file (cached; mtime_ns only acts as the cache key)"""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _load_json(path) -> tuple:
+    """Read and parse one JSON file (path or str), returning (Path, data, error)"""
+    path = Path(path)
+    try:
+        return path, load_candidate(str(path), path.stat().st_mtime_ns), None
+    except Exception as e:
+        return path, None, e
+
+
+def load_candidate_files(paths: list, max_workers: int = 8) -> list:
+    """
+    Read and parse candidate JSON files concurrently.
+    Returns (path, data, error) tuples in the same order as paths.
+    """
+    if len(paths) <= 1:
+        return [_load_json(p) for p in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_load_json, paths))
+
+
+def build_candidates_zip(paths: list) -> bytes:
+    """
+    Zip candidate JSON files for download.
+    The archive is built in a temporary file on disk and read back once, so the
+    finished archive (which st.download_button needs as bytes) is the only copy
+    held in memory.
+    """
+    with tempfile.TemporaryFile() as archive:
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for path in paths:
+                zf.write(path, arcname=os.path.basename(path))
+        archive.seek(0)
+        return archive.read()
+
+
+def process_single_resume(pdf_path, filename: str = None) -> dict:
     """
     Full pipeline for a single resume:
     1. Extract text from PDF
     2. Clean and structure with LLM
+    Extraction results are cached on disk (see result_cache); LLM results
+    are cached by section_resumes itself.
+    
+    pdf_path may be a path or a binary file-like object (pass filename with the latter).
     """
-    # Step 1: Extract text from PDF
-    raw_text = extract_pdf_pdfplumber(pdf_path)
+    pdf_bytes = pdf_path.read() if hasattr(pdf_path, "read") else Path(pdf_path).read_bytes()
+    
+    # Step 1: Extract text from PDF (cached by PDF content)
+    extract_key = (content_hash(pdf_bytes),)
+    raw_text = cache_get("extract", extract_key)
+    if raw_text is None:
+        raw_text = load_extractor_module().extract_text_from_pdf(io.BytesIO(pdf_bytes))
+        if raw_text and not raw_text.isspace():
+            cache_put("extract", extract_key, raw_text)
     
-    if not raw_text.strip():
+    # isspace() tests for blank text without building a stripped copy
+    if not raw_text or raw_text.isspace():
         return {"error": "Could not extract text from PDF"}
     
     # Step 2: Clean the text
-    cleaned_text = clean_text(raw_text)
+    sectioning = load_sectioning_module()
+    cleaned_text = sectioning.clean_text(raw_text)
     
-    # Step 3: Use LLM to structure sections
+    # Step 3: Use LLM to structure sections (cached by cleaned text, so
+    # PDFs that differ only in ways cleaning removes still hit)
     try:
-        sections = section_with_llm(cleaned_text)
+        sections = sectioning.section_with_llm(cleaned_text)
     except Exception as e:
         return {"error": f"LLM processing failed: {e}"}
     
     return {
-        "filename": pdf_path.name,
+        "filename": filename or Path(pdf_path).name,
         "raw_text": raw_text,
         "clean_text": cleaned_text,
         "sections": sections
     }
 
 
+class _ResumeProcessingError(Exception):
+    """Raised inside the cached wrapper so failed analyses aren't memoized"""
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
+def _process_single_resume_cached(pdf_hash: str, filename: str, _pdf_bytes: bytes) -> dict:
+    """process_single_resume cached on pdf_hash (_pdf_bytes is excluded from the key)"""
+    result = process_single_resume(io.BytesIO(_pdf_bytes), filename)
+    if "error" in result:
+        raise _ResumeProcessingError(result["error"])
+    return result
+
+
+def analyze_resume(pdf_bytes: bytes, filename: str) -> dict:
+    """
+    Run process_single_resume on an in-memory PDF, reusing the previous result
+    when the same PDF content has already been analyzed. Errors are never cached.
+    """
+    try:
+        return _process_single_resume_cached(content_hash(pdf_bytes), filename, pdf_bytes)
+    except _ResumeProcessingError as e:
+        return {"error": str(e)}
+
+
+def modules_available(*names: str) -> bool:
+    """Check that modules can be imported, without actually importing them"""
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+# Heavy pipeline modules (PDF parsers, ChromaDB, sentence-transformers,
+# LLM clients) are imported on first use instead of at app start-up
+@st.cache_resource
+def load_extractor_module():
+    """Import pdf_extractor on first use"""
+    import pdf_extractor
+    return pdf_extractor
+
+
+@st.cache_resource
+def load_sectioning_module():
+    """Import section_resumes on first use"""
+    import section_resumes
+    return section_resumes
+
+
+@st.cache_resource
+def load_vector_store_module():
+    """Import build_vector_store on first use"""
+    import build_vector_store
+    return build_vector_store
+
+
+@st.cache_resource
+def load_export_module():
+    """Import export_chroma on first use"""
+    import export_chroma
+    return export_chroma
+
+
+@st.cache_resource
+def load_query_module():
+    """Import query_resumes on first use"""
+    import query_resumes
+    return query_resumes
+
+
+@st.cache_resource
+def load_matching_module():
+    """Import match_resumes on first use"""
+    import match_resumes
+    return match_resumes
+
+
+@st.cache_resource
+def _get_vector_store():
+    """Open the ChromaDB vector store once per process"""
+    return load_query_module().get_vector_store()
+
+
+def get_vector_store():
+    """Get the shared vector store, or None if it hasn't been built yet"""
+    try:
+        return _get_vector_store()
+    except FileNotFoundError:
+        return None
+
+
+def reset_vector_store():
+    """Drop the shared vector store so the next search reopens it (e.g. after a rebuild)"""
+    _get_vector_store.clear()
+
+
+@st.cache_resource
+def _get_pipeline_executor() -> ThreadPoolExecutor:
+    """Single background worker shared by all sessions, so pipeline runs never overlap"""
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def run_pipeline_in_background(steps: list, progress: queue.Queue):
+    """
+    Run (label, func) pipeline steps in order on a background thread.
+    Puts (step_index, total, label) on the progress queue before each step
+    and (total, total, None) when finished. Returns the Future.
+    """
+    def run():
+        total = len(steps)
+        for i, (label, func) in enumerate(steps):
+            progress.put((i, total, label))
+            func()
+        progress.put((total, total, None))
+    
+    return _get_pipeline_executor().submit(run)
+
+
 def get_directories() -> dict:
     """Get all directory paths"""
     return {
@@ -69,6 +322,5 @@ def get_directories() -> dict:
         "data": DATA_DIR,
         "raw": RAW_DIR,
         "text": PROCESSED_TEXT_DIR,
-        "sectioned": PROCESSED_SECTIONED_DIR,
-        "uploads": UPLOADS_DIR
+        "sectioned": PROCESSED_SECTIONED_DIR
     }
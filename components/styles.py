@@ -1,138 +1,17 @@
 """
 SmartHire - Custom CSS Styles
 """
+from pathlib import Path
+
 import streamlit as st
 
+# Read once per process; load_css only re-emits the prebuilt markup
+CSS = (Path(__file__).resolve().parent / "styles.css").read_text(encoding="utf-8")
+CSS_MARKUP = f"<style>\n{CSS}</style>"
+
 
 def load_css():
     """Load custom CSS styling for the app"""
-    st.markdown("""
-    <style>
-    /* Main container */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    
-    /* Hero header */
-    .hero-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        color: white;
-        text-align: center;
-    }
-    
-    .hero-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    
-    .hero-header p {
-        margin: 0.5rem 0 0 0;
-        opacity: 0.9;
-        font-size: 1.1rem;
-    }
-    
-    /* Stats cards */
-    .stat-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-        border: 1px solid #e0e0e0;
-    }
-    
-    .stat-card-primary {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    .stat-card h3 {
-        margin: 0;
-        font-size: 2rem;
-        font-weight: 700;
-    }
-    
-    .stat-card p {
-        margin: 0.5rem 0 0 0;
-        font-size: 0.9rem;
-        opacity: 0.8;
-    }
-    
-    /* Section headers */
-    .section-header {
-        background: #f8f9fa;
-        padding: 1rem 1.5rem;
-        border-radius: 10px;
-        margin: 1.5rem 0 1rem 0;
-        border-left: 4px solid #667eea;
-    }
-    
-    /* Card container */
-    .card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        margin-bottom: 1rem;
-        border: 1px solid #eee;
-    }
-    
-    /* Experience card */
-    .exp-card {
-        background: #fafbfc;
-        padding: 1rem;
-        border-radius: 8px;
-        margin-bottom: 0.8rem;
-        border-left: 3px solid #667eea;
-    }
-    
-    /* Skills tags */
-    .skill-tag {
-        display: inline-block;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        margin: 0.2rem;
-        font-size: 0.85rem;
-    }
-    
-    /* Upload area */
-    .upload-area {
-        border: 2px dashed #667eea;
-        border-radius: 12px;
-        padding: 2rem;
-        text-align: center;
-        background: #f8f9ff;
-        margin: 1rem 0;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px;
-        padding: 10px 20px;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        border-radius: 8px;
-        font-weight: 600;
-    }
-    
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Streamlit drops elements that aren't re-emitted on a rerun,
+    # so the <style> block has to be sent every run
+    st.markdown(CSS_MARKUP, unsafe_allow_html=True)
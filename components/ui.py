@@ -2,8 +2,17 @@
 SmartHire - UI Components
 Reusable Streamlit UI components
 """
+import html
+
 import streamlit as st
 
+# Score bar markup, formatted per candidate with only the color and width
+SCORE_BAR_TEMPLATE = (
+    '<div style="background: #e0e0e0; border-radius: 10px; height: 20px; margin-bottom: 1rem;">'
+    '<div style="background: {color}; width: {score}%; height: 100%; border-radius: 10px;"></div>'
+    '</div>'
+)
+
 
 def render_hero():
     """Render the hero header section"""
@@ -21,22 +30,16 @@ def render_sidebar(stats: dict):
         st.image("https://img.icons8.com/fluency/96/resume.png", width=80)
         st.markdown("### 📊 Dashboard")
         
-        # Stats with colored boxes
+        # Stats with colored boxes, sent as one element instead of three
         st.markdown(f"""
         <div class="stat-card" style="margin-bottom: 10px;">
             <h3>{stats["raw_pdfs"]}</h3>
             <p>📁 Raw PDFs</p>
         </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
         <div class="stat-card" style="margin-bottom: 10px;">
             <h3>{stats["extracted_text"]}</h3>
             <p>📝 Extracted</p>
         </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
         <div class="stat-card stat-card-primary" style="margin-bottom: 10px;">
             <h3>{stats["sectioned_json"]}</h3>
             <p>🤖 AI Processed</p>
@@ -50,75 +53,90 @@ def render_sidebar(stats: dict):
         st.caption("Powered by Groq LLM")
 
 
-def display_sections(sections: dict):
-    """Display resume sections in a nice format"""
-    section_icons = {
-        "summary": "📋",
-        "experience": "💼",
-        "education": "🎓",
-        "skills": "🛠️",
-        "certifications": "📜",
-        "other": "📄"
-    }
+SECTION_ICONS = {
+    "summary": "📋",
+    "experience": "💼",
+    "education": "🎓",
+    "skills": "🛠️",
+    "certifications": "📜",
+    "other": "📄"
+}
+
+
+def _escape(value) -> str:
+    """HTML-escape a value, keeping line breaks (a blank line would end the HTML block)"""
+    return html.escape(str(value)).replace("\n", "<br>")
+
+
+def _section_body_html(section_name: str, content) -> str:
+    """Build the inner HTML for one resume section"""
+    # Handle summary (string)
+    if section_name == "summary":
+        return f"<p>{_escape(content)}</p>"
+    
+    parts = []
+    
+    # Handle experience (list of objects)
+    if section_name == "experience":
+        for exp in content:
+            if isinstance(exp, dict):
+                parts.append(
+                    f"<p><strong>{_escape(exp.get('title', ''))}</strong> at {_escape(exp.get('company', ''))}<br>"
+                    f'<small class="section-caption">{_escape(exp.get("dates", ""))} | {_escape(exp.get("location", ""))}</small></p>'
+                )
+                responsibilities = exp.get("responsibilities", [])
+                if responsibilities:
+                    parts.append("".join(f"<p>• {_escape(resp)}</p>" for resp in responsibilities))
+                parts.append("<hr>")
+            else:
+                parts.append(f"<p>• {_escape(exp)}</p>")
     
+    # Handle education (list of objects)
+    elif section_name == "education":
+        for edu in content:
+            if isinstance(edu, dict):
+                parts.append(
+                    f"<p><strong>{_escape(edu.get('degree', ''))}</strong> in {_escape(edu.get('field', ''))}<br>"
+                    f"{_escape(edu.get('institution', ''))}"
+                )
+                dates = edu.get("dates", "")
+                gpa = edu.get("gpa", "")
+                if dates:
+                    caption = _escape(dates) + (f" | GPA: {_escape(gpa)}" if gpa else "")
+                    parts.append(f'<br><small class="section-caption">{caption}</small>')
+                parts.append("</p><hr>")
+            else:
+                parts.append(f"<p>• {_escape(edu)}</p>")
+    
+    # Handle skills, certifications, other (list of strings)
+    elif isinstance(content, list):
+        if section_name == "skills":
+            parts.append(f"<p>{_escape(' • '.join(str(skill) for skill in content))}</p>")
+        else:
+            parts.append("".join(f"<p>• {_escape(item)}</p>" for item in content))
+    else:
+        parts.append(f"<p>{_escape(content)}</p>")
+    
+    return "".join(parts)
+
+
+def display_sections(sections: dict):
+    """Display resume sections as collapsible cards, rendered in a single call"""
+    blocks = []
     for section_name, content in sections.items():
         if content:
-            icon = section_icons.get(section_name, "📄")
-            with st.expander(f"{icon} {section_name.title()}", expanded=(section_name in ["summary", "skills"])):
-                
-                # Handle summary (string)
-                if section_name == "summary":
-                    st.write(content)
-                
-                # Handle experience (list of objects)
-                elif section_name == "experience":
-                    for exp in content:
-                        if isinstance(exp, dict):
-                            title = exp.get("title", "")
-                            company = exp.get("company", "")
-                            dates = exp.get("dates", "")
-                            location = exp.get("location", "")
-                            
-                            st.markdown(f"**{title}** at {company}")
-                            st.caption(f"{dates} | {location}")
-                            
-                            responsibilities = exp.get("responsibilities", [])
-                            if responsibilities:
-                                for resp in responsibilities:
-                                    st.write(f"• {resp}")
-                            st.divider()
-                        else:
-                            st.write(f"• {exp}")
-                
-                # Handle education (list of objects)
-                elif section_name == "education":
-                    for edu in content:
-                        if isinstance(edu, dict):
-                            degree = edu.get("degree", "")
-                            field = edu.get("field", "")
-                            institution = edu.get("institution", "")
-                            dates = edu.get("dates", "")
-                            gpa = edu.get("gpa", "")
-                            
-                            st.markdown(f"**{degree}** in {field}")
-                            st.write(f"{institution}")
-                            if dates:
-                                st.caption(f"{dates}" + (f" | GPA: {gpa}" if gpa else ""))
-                            st.divider()
-                        else:
-                            st.write(f"• {edu}")
-                
-                # Handle skills, certifications, other (list of strings)
-                elif isinstance(content, list):
-                    if section_name == "skills":
-                        # Display skills as tags/chips
-                        skills_text = " • ".join(content)
-                        st.write(skills_text)
-                    else:
-                        for item in content:
-                            st.write(f"• {item}")
-                else:
-                    st.write(content)
+            icon = SECTION_ICONS.get(section_name, "📄")
+            open_attr = " open" if section_name in ["summary", "skills"] else ""
+            blocks.append(
+                f'<details class="resume-section"{open_attr}>'
+                f"<summary>{icon} {_escape(section_name.title())}</summary>"
+                f'<div class="resume-section-body">{_section_body_html(section_name, content)}</div>'
+                "</details>"
+            )
+    
+    # Native <details> elements collapse without creating Streamlit widgets
+    if blocks:
+        st.markdown("".join(blocks), unsafe_allow_html=True)
 
 
 def render_stat_card(value, label: str, color: str = "#667eea"):
@@ -171,3 +189,8 @@ def render_pipeline_card(title: str, description: str, highlight: bool = False):
         <p style="color: #666;">{description}</p>
     </div>
     """, unsafe_allow_html=True)
+
+
+def render_score_bar(score, color: str):
+    """Render a horizontal match-score bar"""
+    st.markdown(SCORE_BAR_TEMPLATE.format(color=color, score=score), unsafe_allow_html=True)
@@ -1,8 +1,8 @@
 from pathlib import Path
-import json
+import orjson
 from dotenv import load_dotenv
 from langchain_community.vectorstores import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
+from embedding_model import get_embeddings
 
 # =========================
 # PATHS
@@ -19,28 +19,18 @@ CHROMA_DIR.mkdir(parents=True, exist_ok=True)
 # HuggingFace embeddings don't require API keys
 load_dotenv(PROJECT_ROOT / ".env")
 
-# =========================
-# EMBEDDINGS
-# =========================
-# Using HuggingFace embeddings (local, no API calls needed)
-embeddings = HuggingFaceEmbeddings(
-    model_name="sentence-transformers/all-MiniLM-L6-v2"
-)
-
 # =========================
 # HELPERS
 # =========================
 def resume_to_text(sections: dict) -> str:
     parts = []
 
-    if sections.get("summary"):
-        parts.append(sections["summary"])
+    if summary := sections.get("summary"):
+        parts.append(summary)
 
     for exp in sections.get("experience", []):
-        parts.append(
-            f"{exp.get('title', '')} at {exp.get('company', '')}. "
-            + " ".join(exp.get("responsibilities", []))
-        )
+        responsibilities = " ".join(exp.get("responsibilities", []))
+        parts.append(f"{exp.get('title', '')} at {exp.get('company', '')}. {responsibilities}")
 
     for edu in sections.get("education", []):
         parts.append(
@@ -49,7 +39,7 @@ def resume_to_text(sections: dict) -> str:
 
     parts.extend(sections.get("skills", []))
 
-    return "\n".join([p for p in parts if p])
+    return "\n".join(filter(None, parts))
 
 
 # =========================
@@ -64,7 +54,7 @@ def build_vector_store(limit: int = 400):
     print(f"Building embeddings for {len(files)} CVs")
 
     for file in files:
-        data = json.loads(file.read_text(encoding="utf-8"))
+        data = orjson.loads(file.read_bytes())
         sections = data.get("sections", {})
 
         text = resume_to_text(sections)
@@ -81,7 +71,7 @@ def build_vector_store(limit: int = 400):
 
     db = Chroma.from_texts(
         texts=texts,
-        embedding=embeddings,
+        embedding=get_embeddings(),
         metadatas=metadatas,
         persist_directory=str(CHROMA_DIR)
     )
@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+from langchain_huggingface import HuggingFaceEmbeddings
+
+# Same model for building, querying, matching and exporting
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# embed_documents hands every text to one SentenceTransformer.encode call;
+# larger batches than its default of 32 keep the CPU matmuls busier
+ENCODE_BATCH_SIZE = 64
+
+
+@lru_cache(maxsize=1)
+def get_embeddings() -> HuggingFaceEmbeddings:
+    """Load the embedding model on first use and share it across all scripts."""
+    return HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL,
+        encode_kwargs={"batch_size": ENCODE_BATCH_SIZE}
+    )
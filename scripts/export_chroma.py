@@ -1,9 +1,14 @@
 import csv
-import json
+import orjson
 from pathlib import Path
 
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_community.vectorstores import Chroma
+import chromadb
+
+# Collection LangChain's Chroma wrapper writes to when no name is given
+COLLECTION_NAME = "langchain"
+
+# Rows fetched from Chroma per page during export
+EXPORT_PAGE_SIZE = 1000
 
 
 def export_chroma_csv(persist_dir: str = "data/chroma_db", out_path: str = "data/chroma_export.csv", include_embeddings: bool = False) -> int:
@@ -15,21 +20,13 @@ def export_chroma_csv(persist_dir: str = "data/chroma_db", out_path: str = "data
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # load embeddings (same model used to build DB)
-    emb = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-    db = Chroma(persist_directory=str(persist_path), embedding_function=emb)
-
-    col = db._collection
+    # Export only reads stored rows, so open the collection directly instead of
+    # going through LangChain's Chroma, which needs the embedding model loaded
+    col = chromadb.PersistentClient(path=str(persist_path)).get_collection(COLLECTION_NAME)
     include = ["metadatas", "documents"]
     if include_embeddings:
         include.append("embeddings")
 
-    res = col.get(include=include)
-
-    docs = res.get("documents", [])
-    metas = res.get("metadatas", [])
-    embs = res.get("embeddings", [])
-
     with out_path.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         headers = ["id", "source_file", "text"]
@@ -37,29 +34,50 @@ def export_chroma_csv(persist_dir: str = "data/chroma_db", out_path: str = "data
             headers.append("embedding_json")
         writer.writerow(headers)
 
-        for idx in range(len(docs)):
-            meta = metas[idx] if idx < len(metas) else {}
-            doc = docs[idx]
-            emb_vec = embs[idx] if idx < len(embs) else None
-
-            emb_json = ""
-            if include_embeddings and emb_vec is not None:
-                try:
-                    emb_list = emb_vec.tolist() if hasattr(emb_vec, "tolist") else list(emb_vec)
-                    emb_json = json.dumps(emb_list)
-                except Exception:
+        # Page through the collection so only EXPORT_PAGE_SIZE rows
+        # (and their embeddings) are held in memory at a time
+        idx = 0
+        while True:
+            res = col.get(include=include, limit=EXPORT_PAGE_SIZE, offset=idx)
+
+            docs = res.get("documents") or []
+            metas = res.get("metadatas") or []
+            embs = res.get("embeddings")
+            if embs is None:
+                embs = []
+            if not docs:
+                break
+
+            rows = []
+            for i, doc in enumerate(docs):
+                meta = (metas[i] if i < len(metas) else None) or {}
+                emb_vec = embs[i] if i < len(embs) else None
+
+                emb_json = ""
+                if include_embeddings and emb_vec is not None:
                     try:
-                        emb_json = json.dumps(list(emb_vec))
+                        # orjson serializes numpy arrays natively, without a
+                        # tolist() round trip through Python floats
+                        emb_json = orjson.dumps(emb_vec, option=orjson.OPT_SERIALIZE_NUMPY).decode()
                     except Exception:
-                        emb_json = ""
+                        try:
+                            emb_json = orjson.dumps(list(emb_vec), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+                        except Exception:
+                            emb_json = ""
+
+                row = [idx, meta.get("source_file", ""), doc.replace("\n", " ")]
+                if include_embeddings:
+                    row.append(emb_json)
+                rows.append(row)
+                idx += 1
 
-            row = [idx, meta.get("source_file", ""), doc.replace("\n", " ")]
-            if include_embeddings:
-                row.append(emb_json)
-            writer.writerow(row)
+            # One writerows call per page instead of one writerow per row
+            writer.writerows(rows)
 
-    return len(docs)
+            if len(docs) < EXPORT_PAGE_SIZE:
+                break
 
+    return idx
 
 if __name__ == "__main__":
     n = export_chroma_csv()
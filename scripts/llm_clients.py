@@ -0,0 +1,57 @@
+"""
+SmartHire - LLM Clients
+Shared, lazily built API clients so each is created at most once per process
+"""
+from pathlib import Path
+import os
+import importlib.util
+from functools import lru_cache
+import httpx
+from openai import OpenAI, DefaultHttpxClient
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Parsed once here instead of by every script that needs an API key
+load_dotenv(PROJECT_ROOT / ".env")
+
+
+@lru_cache(maxsize=1)
+def get_openrouter_client() -> OpenAI:
+    """OpenRouter client used for question answering and resume scoring."""
+    return OpenAI(
+        api_key=os.getenv("OPENROUTER_API_KEY"),
+        base_url="https://openrouter.ai/api/v1"
+    )
+
+
+@lru_cache(maxsize=1)
+def get_groq_client() -> OpenAI:
+    """
+    Groq - Free & Fast LLM inference (cloud).
+    The client is shared by all sectioning calls so its connection pool is reused.
+    httpx drops idle connections after 5s by default, which is shorter than the
+    gaps the rate limiter leaves between calls - keep them alive longer so each
+    call skips the TCP + TLS handshake. With h2 installed, concurrent calls are
+    multiplexed over one HTTP/2 connection instead of one connection each.
+    """
+    return OpenAI(
+        api_key=os.getenv("GROQ_API_KEY"),
+        base_url="https://api.groq.com/openai/v1",
+        http_client=DefaultHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60)
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def get_ollama_client() -> OpenAI:
+    """
+    Ollama - Local LLM (unlimited, no rate limits).
+    Make sure Ollama is running: ollama serve
+    """
+    return OpenAI(
+        api_key="ollama",  # Ollama doesn't need a real key
+        base_url="http://localhost:11434/v1"
+    )
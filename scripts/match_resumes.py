@@ -3,14 +3,17 @@ SmartHire - Resume Matching System (Week 8)
 Compare candidates against job descriptions with scoring (0-100) and reasoning.
 """
 from pathlib import Path
-import os
-import json
 import time
-from openai import OpenAI
-from dotenv import load_dotenv
+from functools import lru_cache
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+import orjson
+
+from result_cache import cache_get, cache_put
+from llm_clients import get_openrouter_client
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-load_dotenv(PROJECT_ROOT / ".env")
 
 # ===========================================
 # PATHS
@@ -20,13 +23,21 @@ JSON_PATH = PROJECT_ROOT / "data" / "processed" / "resumes_sectioned_json"
 # ===========================================
 # LLM SETUP (OpenRouter - same as query_resumes)
 # ===========================================
-llm_client = OpenAI(
-    api_key=os.getenv("OPENROUTER_API_KEY"),
-    base_url="https://openrouter.ai/api/v1"
-)
-
 LLM_MODEL = "deepseek/deepseek-chat"
 
+# Scoring is network-bound, so several calls run at once; call starts are
+# still spaced out to stay under the OpenRouter rate limit
+MAX_CONCURRENT_SCORING = 8
+DELAY_BETWEEN_CALLS = 0.5  # seconds between scoring call starts
+
+_rate_limit_lock = threading.Lock()
+_next_call_time = 0.0
+
+# Scores for (prompt, resume, job, model) combinations already seen, so re-running
+# the same job description doesn't pay for the LLM calls again, while editing
+# SCORING_PROMPT starts from fresh scores
+SCORE_CACHE_TTL = 7 * 24 * 3600  # seconds
+
 # ===========================================
 # SCORING PROMPT
 # ===========================================
@@ -64,8 +75,8 @@ def build_resume_text(sections: dict) -> str:
     """Build a text representation of a resume for matching."""
     parts = []
     
-    if sections.get("summary"):
-        parts.append(f"SUMMARY: {sections['summary']}")
+    if summary := sections.get("summary"):
+        parts.append(f"SUMMARY: {summary}")
     
     # Experience
     experience = sections.get("experience", [])
@@ -74,10 +85,9 @@ def build_resume_text(sections: dict) -> str:
         for exp in experience:
             if isinstance(exp, dict):
                 exp_text = f"- {exp.get('title', '')} at {exp.get('company', '')}"
-                if exp.get('dates'):
-                    exp_text += f" ({exp.get('dates')})"
-                responsibilities = exp.get('responsibilities', [])
-                if responsibilities:
+                if dates := exp.get('dates'):
+                    exp_text += f" ({dates})"
+                if responsibilities := exp.get('responsibilities'):
                     exp_text += ": " + "; ".join(responsibilities[:5])
                 exp_texts.append(exp_text)
         if exp_texts:
@@ -95,13 +105,11 @@ def build_resume_text(sections: dict) -> str:
             parts.append("EDUCATION:\n" + "\n".join(edu_texts))
     
     # Skills
-    skills = sections.get("skills", [])
-    if skills:
+    if skills := sections.get("skills"):
         parts.append(f"SKILLS: {', '.join(skills)}")
     
     # Certifications
-    certs = sections.get("certifications", [])
-    if certs:
+    if certs := sections.get("certifications"):
         parts.append(f"CERTIFICATIONS: {', '.join(certs)}")
     
     return "\n\n".join(parts)
@@ -114,7 +122,13 @@ def score_resume(resume_text: str, job_description: str, retries: int = 2) -> di
     """
     Score a single resume against a job description.
     Returns dict with score, strengths, gaps, reasoning.
+    Successful results are cached on disk (see result_cache).
     """
+    cache_key = (SCORING_PROMPT, resume_text, job_description, LLM_MODEL)
+    cached = cache_get("scores", cache_key, SCORE_CACHE_TTL)
+    if cached is not None:
+        return cached
+    
     user_prompt = f"""JOB DESCRIPTION:
 {job_description}
 
@@ -125,26 +139,29 @@ Analyze how well this candidate matches the job requirements and provide a score
 
     for attempt in range(retries):
         try:
-            response = llm_client.chat.completions.create(
+            wait_for_rate_limit()
+            response = get_openrouter_client().chat.completions.create(
                 model=LLM_MODEL,
                 messages=[
                     {"role": "system", "content": SCORING_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.2,
-                max_tokens=800
+                max_tokens=800,
+                # JSON mode: the reply is a bare JSON object, so parse retries are rare
+                response_format={"type": "json_object"}
             )
             
             content = response.choices[0].message.content.strip()
             
-            # Remove markdown if present
+            # Remove markdown if present (providers that ignore JSON mode)
             if content.startswith("```"):
                 content = content.split("```")[1]
                 if content.startswith("json"):
                     content = content[4:]
                 content = content.strip()
             
-            result = json.loads(content)
+            result = orjson.loads(content)
             
             # Validate required fields
             if "score" not in result:
@@ -158,9 +175,10 @@ Analyze how well this candidate matches the job requirements and provide a score
             if "summary" not in result:
                 result["summary"] = f"Match score: {result['score']}/100"
             
+            cache_put("scores", cache_key, result, SCORE_CACHE_TTL)
             return result
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             if attempt < retries - 1:
                 time.sleep(1)
                 continue
@@ -184,6 +202,147 @@ Analyze how well this candidate matches the job requirements and provide a score
             }
 
 
+# ===========================================
+# HELPER: Score several resumes concurrently
+# ===========================================
+def wait_for_rate_limit():
+    """Space out scoring calls by DELAY_BETWEEN_CALLS, across all worker threads."""
+    global _next_call_time
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait_time = _next_call_time - now
+        _next_call_time = max(now, _next_call_time) + DELAY_BETWEEN_CALLS
+    
+    if wait_time > 0:
+        time.sleep(wait_time)
+
+
+@lru_cache(maxsize=2048)
+def _load_resume_cached(path_str: str, mtime_ns: int) -> tuple:
+    """Parse a resume file into (resume_text, skills); mtime_ns only acts as the cache key."""
+    data = orjson.loads(Path(path_str).read_bytes())
+    sections = data.get("sections", {})
+    return build_resume_text(sections), tuple(sections.get("skills", []))
+
+
+def load_resume(json_file: Path) -> tuple:
+    """
+    Get (resume_text, skills) for a resume file.
+    Memoized, so repeated matches with different job descriptions skip the read and parse.
+    """
+    return _load_resume_cached(str(json_file), json_file.stat().st_mtime_ns)
+
+
+def _score_file(json_file: Path, job_description: str):
+    """Load and score one resume file. Returns None if it has no resume text."""
+    resume_text, skills = load_resume(json_file)
+    
+    if not resume_text.strip():
+        return None
+    
+    score_result = score_resume(resume_text, job_description)
+    
+    return {
+        "candidate_id": json_file.stem,
+        "score": score_result.get("score", 0),
+        "summary": score_result.get("summary", ""),
+        "strengths": score_result.get("strengths", []),
+        "gaps": score_result.get("gaps", []),
+        "reasoning": score_result.get("reasoning", ""),
+        "skills": list(skills)
+    }
+
+
+def score_files(json_files: list, job_description: str, progress_callback=None) -> list[dict]:
+    """
+    Score resume files against a job description on a thread pool.
+    progress_callback is called from the calling thread as each file finishes.
+    Returns results sorted by score (highest first).
+    """
+    results = []
+    total = len(json_files)
+    if not total:
+        return results
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_SCORING, total)) as executor:
+        futures = {executor.submit(_score_file, f, job_description): f for f in json_files}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+                if result:
+                    results.append(result)
+            except Exception as e:
+                print(f"Error processing {futures[future].name}: {e}")
+            
+            if progress_callback:
+                progress_callback(done, total)
+    
+    results.sort(key=lambda x: -x["score"])
+    return results
+
+
+# ===========================================
+# HELPER: Rank resumes by embedding similarity
+# ===========================================
+# Normalized resume embeddings: path -> (mtime_ns, vector). Reused until the
+# file changes, so a fallback match only embeds new or edited resumes
+_resume_vectors = {}
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so a dot product is the cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def rank_by_similarity(job_description: str, json_files: list, n_candidates: int) -> list:
+    """
+    Rank resume files by cosine similarity to the job description.
+    Resume vectors are memoized by (path, mtime); the job and any resumes not
+    embedded yet go through a single batched call.
+    """
+    from embedding_model import get_embeddings
+    
+    files = []
+    rows = []
+    misses = []  # (row index, path, mtime_ns, resume text)
+    for json_file in json_files:
+        path_str = str(json_file)
+        try:
+            mtime_ns = json_file.stat().st_mtime_ns
+            cached = _resume_vectors.get(path_str)
+            if cached is not None and cached[0] == mtime_ns:
+                vector = cached[1]
+            else:
+                resume_text, _ = _load_resume_cached(path_str, mtime_ns)
+                if not resume_text.strip():
+                    continue
+                vector = None
+                misses.append((len(rows), path_str, mtime_ns, resume_text))
+        except Exception:
+            continue
+        files.append(json_file)
+        rows.append(vector)
+    
+    if not files:
+        return []
+    
+    texts = [job_description] + [resume_text for *_, resume_text in misses]
+    vectors = _normalize_rows(np.asarray(get_embeddings().embed_documents(texts), dtype=np.float32))
+    for (row, path_str, mtime_ns, _), vector in zip(misses, vectors[1:]):
+        _resume_vectors[path_str] = (mtime_ns, vector)
+        rows[row] = vector
+    
+    # One matrix-vector product gives every cosine similarity
+    scores = np.stack(rows) @ vectors[0]
+    
+    # Partition out the top k in O(N), then sort only those k
+    k = min(n_candidates, len(scores))
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
+    return [files[i] for i in top_idx]
+
+
 # ===========================================
 # MAIN: Match all resumes against job
 # ===========================================
@@ -205,61 +364,22 @@ def match_all_resumes(job_description: str, limit: int = 20, progress_callback=N
     if not json_files:
         raise ValueError("No resume JSON files found. Run the pipeline first.")
     
-    results = []
-    total = len(json_files)
-    
-    for i, json_file in enumerate(json_files):
-        try:
-            # Load resume
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            sections = data.get("sections", {})
-            resume_text = build_resume_text(sections)
-            
-            if not resume_text.strip():
-                continue
-            
-            # Score against job description
-            score_result = score_resume(resume_text, job_description)
-            
-            results.append({
-                "candidate_id": json_file.stem,
-                "score": score_result.get("score", 0),
-                "summary": score_result.get("summary", ""),
-                "strengths": score_result.get("strengths", []),
-                "gaps": score_result.get("gaps", []),
-                "reasoning": score_result.get("reasoning", ""),
-                "skills": sections.get("skills", [])
-            })
-            
-            # Progress callback
-            if progress_callback:
-                progress_callback(i + 1, total)
-            
-            # Small delay to avoid rate limits
-            if i < total - 1:
-                time.sleep(0.5)
-                
-        except Exception as e:
-            print(f"Error processing {json_file.name}: {e}")
-            continue
-    
-    # Sort by score (highest first)
-    results.sort(key=lambda x: -x["score"])
-    
-    return results
+    return score_files(json_files, job_description, progress_callback)
 
 
-def match_top_candidates(job_description: str, n_candidates: int = 10, progress_callback=None) -> list[dict]:
+def match_top_candidates(job_description: str, n_candidates: int = 10, progress_callback=None, db=None) -> list[dict]:
     """
     Smart matching: First use semantic search to find likely matches,
     then score only those candidates (faster than scoring all).
+    
+    `db` is an optional already-open vector store passed through to search_resumes.
     """
     # Try to use semantic search first for efficiency
     try:
         from query_resumes import search_resumes
         
         # Get top candidates from semantic search (only request what we need)
-        search_results = search_resumes(job_description, n_results=n_candidates)
+        search_results = search_resumes(job_description, n_results=n_candidates, db=db)
         candidate_ids = [r["id"] for r in search_results]
         
     except Exception:
@@ -273,44 +393,15 @@ def match_top_candidates(job_description: str, n_candidates: int = 10, progress_
     if candidate_ids:
         json_files = [JSON_PATH / f"{cid}.json" for cid in candidate_ids if (JSON_PATH / f"{cid}.json").exists()][:n_candidates]
     else:
-        json_files = sorted(JSON_PATH.glob("*.json"))[:n_candidates]
-    
-    results = []
-    total = len(json_files)
-    
-    for i, json_file in enumerate(json_files):
+        # No vector store - rank every resume with one batched embedding call
+        all_files = sorted(JSON_PATH.glob("*.json"))
         try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            sections = data.get("sections", {})
-            resume_text = build_resume_text(sections)
-            
-            if not resume_text.strip():
-                continue
-            
-            score_result = score_resume(resume_text, job_description)
-            
-            results.append({
-                "candidate_id": json_file.stem,
-                "score": score_result.get("score", 0),
-                "summary": score_result.get("summary", ""),
-                "strengths": score_result.get("strengths", []),
-                "gaps": score_result.get("gaps", []),
-                "reasoning": score_result.get("reasoning", ""),
-                "skills": sections.get("skills", [])
-            })
-            
-            if progress_callback:
-                progress_callback(i + 1, total)
-            
-            if i < total - 1:
-                time.sleep(0.5)
-                
+            json_files = rank_by_similarity(job_description, all_files, n_candidates)
         except Exception as e:
-            print(f"Error: {e}")
-            continue
+            print(f"Embedding ranking error: {e}")
+            json_files = all_files[:n_candidates]
     
-    results.sort(key=lambda x: -x["score"])
-    return results
+    return score_files(json_files, job_description, progress_callback)
 
 
 # ===========================================
@@ -1,6 +1,17 @@
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import mmap
+import multiprocessing
 import pdfplumber
 
+# PyMuPDF is much faster than pdfplumber; pdfplumber stays as a fallback
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 RAW_DIR = PROJECT_ROOT / "data" / "raw" / "fake_resumes"
@@ -8,35 +19,122 @@ PROCESSED_DIR = PROJECT_ROOT / "data" / "processed" / "resumes_text"
 
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+def _extract_with_pymupdf(pdf_path) -> str:
+    if hasattr(pdf_path, "read"):
+        doc = fitz.open(stream=pdf_path.read(), filetype="pdf")
+    else:
+        doc = fitz.open(pdf_path)
+    
+    with doc:
+        pages = [page.get_text("text") for page in doc]
+    return "".join(page_text + "\n" for page_text in pages if page_text)
+
+
+def _extract_with_pdfplumber(pdf_path) -> str:
+    if hasattr(pdf_path, "read"):
+        return _pdfplumber_text(pdf_path)
+
+    # Map the file once so pdfminer's many small seeks/reads across the
+    # xref table are served from memory instead of separate read syscalls
+    with open(pdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return _pdfplumber_text(mapped)
+
+
+def _pdfplumber_text(stream) -> str:
+    # pdfplumber skips pdfminer's layout analysis by default (laparams=None),
+    # which is the fast path for plain text - don't pass LAParams here
+    pages = []
+    with pdfplumber.open(stream) as pdf:
+        for page in pdf.pages:
+            pages.append(page.extract_text())
+            # Drop the page's parsed chars/objects so memory stays flat on long PDFs
+            page.flush_cache()
+    return "".join(page_text + "\n" for page_text in pages if page_text)
+
+
+def extract_text_from_pdf(pdf_path) -> str:
+    """Extract text from a PDF given as a path or a binary file-like object."""
+    if PYMUPDF_AVAILABLE:
+        try:
+            return _extract_with_pymupdf(pdf_path)
+        except Exception as e:
+            print(f"PyMuPDF failed on {getattr(pdf_path, 'name', 'PDF')}, retrying with pdfplumber: {e}")
+            if hasattr(pdf_path, "seek"):
+                pdf_path.seek(0)
+
     text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        text = _extract_with_pdfplumber(pdf_path)
     except Exception as e:
-        print(f"Failed to process {pdf_path.name}: {e}")
+        print(f"Failed to process {getattr(pdf_path, 'name', 'PDF')}: {e}")
     return text
 
 
-def process_all_pdfs():
-    pdf_files = list(RAW_DIR.rglob("*.pdf"))
-    print(f"Found {len(pdf_files)} PDF files")
+def _extract_one(pdf_file: Path) -> bool:
+    """Extract a single PDF to PROCESSED_DIR. Runs in a worker process."""
+    text = extract_text_from_pdf(pdf_file)
+
+    if not text or text.isspace():
+        return False
 
-    for pdf_file in pdf_files:
-        output_file = PROCESSED_DIR / f"{pdf_file.stem}.txt"
+    output_file = PROCESSED_DIR / f"{pdf_file.stem}.txt"
+    output_file.write_text(text, encoding="utf-8")
+    return True
 
-        if output_file.exists():
-            continue
 
-        text = extract_text_from_pdf(pdf_file)
+def _worker_context():
+    """
+    Start method for the extraction workers, passed to their executor only
+    (the process-wide default start method is left alone).
+    The caller is usually the multi-threaded Streamlit server, and forking a
+    threaded process can deadlock on locks other threads hold. A fork server
+    is a clean single-threaded process with this module (and pdfplumber /
+    PyMuPDF) preloaded, so workers fork from it without re-importing them;
+    spawn is the fallback where fork servers aren't supported (Windows).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # multiprocessing keeps one fork server per process, so this preload list
+        # is process-wide: it applies to any forkserver pool started after it, and
+        # only takes effect if the fork server isn't running yet. Nothing else in
+        # the app uses forkserver, and preloading this module is harmless if it did.
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
 
-        if text.strip():
-            output_file.write_text(text, encoding="utf-8")
-        else:
+
+def process_all_pdfs(max_workers: int = None, progress_callback=None):
+    """
+    Extract every PDF in RAW_DIR that has no text file yet.
+    progress_callback: Optional function(current, total) called as each PDF finishes
+    """
+    pdf_files = list(RAW_DIR.rglob("*.pdf"))
+    print(f"Found {len(pdf_files)} PDF files")
+
+    pending_files = [
+        pdf_file for pdf_file in pdf_files
+        if not (PROCESSED_DIR / f"{pdf_file.stem}.txt").exists()
+    ]
+    total = len(pending_files)
+
+    def report(done: int, pdf_file: Path, extracted: bool):
+        if not extracted:
             print(f"No text extracted from {pdf_file.name}")
+        if progress_callback:
+            progress_callback(done, total)
+
+    # Extraction is CPU-bound, so spread the PDFs over worker processes
+    if total > 1:
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=_worker_context()
+        ) as executor:
+            futures = {executor.submit(_extract_one, pdf_file): pdf_file for pdf_file in pending_files}
+            for done, future in enumerate(as_completed(futures), 1):
+                report(done, futures[future], future.result())
+    else:
+        for done, pdf_file in enumerate(pending_files, 1):
+            report(done, pdf_file, _extract_one(pdf_file))
 
     print("PDF extraction completed")
 
@@ -4,16 +4,15 @@ Query ChromaDB and answer questions about candidates using RAG
 Works for any industry - not just IT
 """
 from pathlib import Path
-import os
-import json
 import re
-from openai import OpenAI
-from dotenv import load_dotenv
-from langchain_huggingface import HuggingFaceEmbeddings
+import orjson
+from functools import lru_cache
+from embedding_model import get_embeddings
+from result_cache import cache_get, cache_put
+from llm_clients import get_openrouter_client
 from langchain_community.vectorstores import Chroma
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-load_dotenv(PROJECT_ROOT / ".env")
 
 # ===========================================
 # PATHS
@@ -24,10 +23,6 @@ JSON_PATH = PROJECT_ROOT / "data" / "processed" / "resumes_sectioned_json"
 # ===========================================
 # CHROMADB SETUP
 # ===========================================
-embeddings = HuggingFaceEmbeddings(
-    model_name="sentence-transformers/all-MiniLM-L6-v2"
-)
-
 def get_vector_store():
     """Get the ChromaDB vector store."""
     if not CHROMA_PATH.exists():
@@ -35,20 +30,19 @@ def get_vector_store():
     
     return Chroma(
         persist_directory=str(CHROMA_PATH),
-        embedding_function=embeddings
+        embedding_function=get_embeddings()
     )
 
 # ===========================================
 # LLM SETUP (OpenRouter)
 # ===========================================
-llm_client = OpenAI(
-    api_key=os.getenv("OPENROUTER_API_KEY"),
-    base_url="https://openrouter.ai/api/v1"
-)
-
 # OpenRouter models
 LLM_MODEL = "deepseek/deepseek-chat"
 
+# Answers are cached by question + retrieved context, so a repeated question
+# only reaches the LLM again once the matching resumes change
+ANSWER_CACHE_TTL = 24 * 3600  # seconds
+
 # ===========================================
 # HELPER: Build full resume text from JSON
 # ===========================================
@@ -107,24 +101,65 @@ def build_resume_text(sections: dict) -> str:
 # SEARCH: By keywords in skills/content
 # ===========================================
 
+# Keyword extraction, built once at import
+STOP_WORDS = frozenset({"show", "me", "find", "with", "the", "and", "or", "a", "an", "is", 
+                        "are", "has", "have", "who", "what", "where", "when", "candidates",
+                        "experience", "skills", "any", "all", "some", "looking", "for", "need"})
+
+# Words, or multi-word phrases in quotes
+KEYWORD_RE = re.compile(r'"([^"]+)"|(\b\w+\b)')
+
+
 def extract_keywords(query: str) -> list[str]:
     """Extract meaningful keywords from a query (2+ characters, not stop words)."""
-    stop_words = {"show", "me", "find", "with", "the", "and", "or", "a", "an", "is", 
-                  "are", "has", "have", "who", "what", "where", "when", "candidates",
-                  "experience", "skills", "any", "all", "some", "looking", "for", "need"}
-    
-    # Extract words (including multi-word phrases in quotes)
-    words = re.findall(r'"([^"]+)"|(\b\w+\b)', query.lower())
     keywords = []
     
-    for match in words:
-        word = match[0] if match[0] else match[1]
-        if word and len(word) >= 2 and word not in stop_words:
+    for match in KEYWORD_RE.finditer(query.lower()):
+        word = match.group(1) or match.group(2)
+        if word and len(word) >= 2 and word not in STOP_WORDS:
             keywords.append(word)
     
     return keywords
 
 
+@lru_cache(maxsize=1)
+def _list_resume_files(mtime_ns: int) -> tuple:
+    """List the resume JSON files (cached; mtime_ns only acts as the cache key)."""
+    return tuple(JSON_PATH.glob("*.json"))
+
+
+def list_resume_files() -> tuple:
+    """
+    Get the resume JSON files, re-listing the directory only after files are
+    added or removed (which changes its mtime).
+    """
+    return _list_resume_files(JSON_PATH.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _load_searchable_cached(path_str: str, mtime_ns: int) -> tuple:
+    """Parse a resume file into (content, lowercase content, lowercase skills); mtime_ns only acts as the cache key."""
+    sections = orjson.loads(Path(path_str).read_bytes()).get("sections", {})
+    content = build_resume_text(sections)
+    return content, content.lower(), tuple(s.lower() for s in sections.get("skills", []))
+
+
+def load_searchable(json_file: Path) -> tuple:
+    """
+    Get (content, lowercase content, lowercase skills) for a resume file.
+    Memoized, so each file is only parsed again after it changes.
+    """
+    return _load_searchable_cached(str(json_file), json_file.stat().st_mtime_ns)
+
+
+def _try_load_searchable(json_file: Path):
+    """load_searchable, returning None for unreadable files."""
+    try:
+        return load_searchable(json_file)
+    except Exception:
+        return None
+
+
 def search_by_keywords(keywords: list[str], limit: int = 10) -> list[dict]:
     """
     Search for candidates matching any of the keywords in their skills or content.
@@ -135,47 +170,45 @@ def search_by_keywords(keywords: list[str], limit: int = 10) -> list[dict]:
     if not JSON_PATH.exists() or not keywords:
         return []
     
-    for json_file in JSON_PATH.glob("*.json"):
-        try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            sections = data.get("sections", {})
-            
-            # Build searchable text
-            full_text = build_resume_text(sections).lower()
-            skills = [s.lower() for s in sections.get("skills", [])]
-            
-            # Check for keyword matches
-            matched_keywords = []
-            for kw in keywords:
-                # Check in skills first (more precise)
-                skill_match = any(kw in skill or skill in kw for skill in skills)
-                # Then check in full text
-                text_match = kw in full_text
-                
-                if skill_match or text_match:
-                    matched_keywords.append(kw)
-            
-            if matched_keywords:
-                content = build_resume_text(sections)
-                matches.append({
-                    "id": json_file.stem,
-                    "content": content,
-                    "matched_keywords": matched_keywords,
-                    "score": len(matched_keywords) / len(keywords),  # Score by match ratio
-                    "match_type": "exact"
-                })
-        except Exception:
+    files = list_resume_files()
+    
+    # Loading is memoized, so a warm query is only a stat and a cache lookup
+    # per file - cheaper done inline than handed to a thread pool
+    for json_file in files:
+        loaded = _try_load_searchable(json_file)
+        if loaded is None:
             continue
+        content, full_text, skills = loaded
+        
+        # Check for keyword matches
+        # The skills are part of full_text, so "kw in skill" is already covered
+        # by the text check; only "skill in kw" (e.g. "aws" for "aws lambda")
+        # needs the per-skill scan, and only when the text check misses
+        matched_keywords = [
+            kw for kw in keywords
+            if kw in full_text or any(skill in kw for skill in skills)
+        ]
+        
+        if matched_keywords:
+            matches.append({
+                "id": json_file.stem,
+                "content": content,
+                "matched_keywords": matched_keywords,
+                "score": len(matched_keywords) / len(keywords),  # Score by match ratio
+                "match_type": "exact"
+            })
     
     # Sort by score (most keyword matches first)
     matches.sort(key=lambda x: -x["score"])
     return matches[:limit]
 
 
-def search_resumes(query: str, n_results: int = 5) -> list[dict]:
+def search_resumes(query: str, n_results: int = 5, db=None) -> list[dict]:
     """
     Hybrid search: combines keyword matching with semantic search.
     Returns deduplicated results.
+    
+    Pass an already-open vector store as `db` to skip reopening ChromaDB.
     """
     all_matches = []
     seen_ids = set()
@@ -193,7 +226,8 @@ def search_resumes(query: str, n_results: int = 5) -> list[dict]:
     # Step 2: Semantic search to find more matches
     if len(all_matches) < n_results:
         try:
-            db = get_vector_store()
+            if db is None:
+                db = get_vector_store()
             semantic_results = db.similarity_search_with_score(query, k=n_results * 3)
             
             for doc, score in semantic_results:
@@ -222,13 +256,13 @@ def search_resumes(query: str, n_results: int = 5) -> list[dict]:
     return all_matches[:n_results]
 
 
-def answer_question(question: str, n_results: int = 5) -> dict:
+def answer_question(question: str, n_results: int = 5, db=None) -> dict:
     """
     Answer a question about resumes using RAG.
     """
     # Step 1: Retrieve relevant resumes
     try:
-        matches = search_resumes(question, n_results=n_results)
+        matches = search_resumes(question, n_results=n_results, db=db)
     except FileNotFoundError as e:
         return {
             "answer": str(e),
@@ -280,21 +314,27 @@ RESUME CONTEXT:
 
 Provide a clear, helpful answer listing the relevant candidates."""
 
-    try:
-        response = llm_client.chat.completions.create(
-            model=LLM_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=1000
-        )
-        
-        answer = response.choices[0].message.content
-        
-    except Exception as e:
-        answer = f"Error getting AI response: {e}"
+    cache_key = (system_prompt, user_prompt, LLM_MODEL)
+    answer = cache_get("answers", cache_key, ANSWER_CACHE_TTL)
+    
+    if answer is None:
+        try:
+            response = get_openrouter_client().chat.completions.create(
+                model=LLM_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=1000
+            )
+            
+            answer = response.choices[0].message.content
+            if answer:
+                cache_put("answers", cache_key, answer, ANSWER_CACHE_TTL)
+            
+        except Exception as e:
+            answer = f"Error getting AI response: {e}"
     
     return {
         "answer": answer,
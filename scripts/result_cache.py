@@ -0,0 +1,94 @@
+"""
+SmartHire - Result Cache
+On-disk cache for pipeline and LLM results, keyed by everything that went into them
+"""
+from pathlib import Path
+import time
+import hashlib
+import threading
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Layout: data/cache/<stage>/<digest>.json
+CACHE_DIR = PROJECT_ROOT / "data" / "cache"
+
+# Entries are only checked against their TTL on read, so each stage is swept
+# every so often to keep data/cache from growing without bound
+MAX_ENTRIES_PER_STAGE = 10000
+PRUNE_INTERVAL = 3600  # seconds between sweeps of one stage, per process
+
+_prune_lock = threading.Lock()
+_last_prune = {}
+
+
+def content_hash(data: bytes) -> str:
+    """Hash raw content into a short hex digest used in cache keys."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cache_path(stage: str, key_parts: tuple) -> Path:
+    """Path of the entry for key_parts (joined with NUL so parts can't run together)."""
+    key = "\x00".join(key_parts).encode("utf-8")
+    return CACHE_DIR / stage / f"{content_hash(key)}.json"
+
+
+def cache_get(stage: str, key_parts: tuple, ttl: float = float("inf")):
+    """Get a cached result, or None if missing or older than ttl seconds."""
+    path = _cache_path(stage, key_parts)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(stage: str, key_parts: tuple, result, ttl: float = float("inf")):
+    """
+    Store a result (written to a per-thread temp file first so entries are never
+    partial and concurrent writers of the same key don't collide). Failures only
+    cost a cache miss. ttl is the stage's read TTL, used when sweeping the stage.
+    """
+    path = _cache_path(stage, key_parts)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(result))
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"Could not write cache entry: {e}")
+        return
+
+    now = time.monotonic()
+    with _prune_lock:
+        if stage in _last_prune and now - _last_prune[stage] < PRUNE_INTERVAL:
+            return
+        _last_prune[stage] = now
+    prune_cache(stage, max_age=ttl)
+
+
+def prune_cache(stage: str, max_age: float = float("inf"), max_entries: int = MAX_ENTRIES_PER_STAGE) -> int:
+    """
+    Delete a stage's entries older than max_age seconds, then the oldest ones
+    beyond max_entries. Returns the number of entries removed.
+    """
+    entries = []
+    for path in (CACHE_DIR / stage).glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+
+    # Newest first, so everything from index max_entries on is over the cap
+    entries.sort(reverse=True)
+    now = time.time()
+    removed = 0
+    for i, (mtime, path) in enumerate(entries):
+        if i >= max_entries or now - mtime > max_age:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
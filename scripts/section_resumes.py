@@ -1,37 +1,31 @@
 from pathlib import Path
-import json
 import re
+import orjson
 import os
 import time
-from openai import OpenAI
-from dotenv import load_dotenv
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from openai import RateLimitError, APITimeoutError, APIConnectionError, InternalServerError
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
+from result_cache import cache_get, cache_put
+from llm_clients import get_groq_client, get_ollama_client
 
-# Load environment variables from .env file
-load_dotenv(PROJECT_ROOT / ".env")
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 INPUT_DIR = PROJECT_ROOT / "data" / "processed" / "resumes_text"
 OUTPUT_DIR = PROJECT_ROOT / "data" / "processed" / "resumes_sectioned_json"
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Index of the sectioned JSON files, read by the app instead of globbing OUTPUT_DIR
+MANIFEST_PATH = OUTPUT_DIR.parent / "resumes_sectioned_manifest.json"
+
 # ===========================================
 # CLIENT CONFIGURATION
 # ===========================================
 
-# Groq - Free & Fast LLM inference (cloud)
-groq_client = OpenAI(
-    api_key=os.getenv("GROQ_API_KEY"),
-    base_url="https://api.groq.com/openai/v1"
-)
-
-# Ollama - Local LLM (unlimited, no rate limits)
-# Make sure Ollama is running: ollama serve
-ollama_client = OpenAI(
-    api_key="ollama",  # Ollama doesn't need a real key
-    base_url="http://localhost:11434/v1"
-)
+# Clients are built on first use in llm_clients (see get_current_client)
 
 # ===========================================
 # MODEL CONFIGURATION
@@ -48,36 +42,57 @@ OLLAMA_MODEL = "llama3.2"  # or "llama3.1:8b", "mistral", etc.
 # Track current provider and model
 current_provider = "groq"  # "groq" or "ollama"
 current_model = GROQ_PRIMARY
+# Guards provider/model changes made from sectioning worker threads
+_provider_lock = threading.Lock()
 
 # Rate limit settings
-DELAY_BETWEEN_CALLS = 3  # seconds between API calls (only for cloud)
+DELAY_BETWEEN_CALLS = 3  # seconds between API call starts (only for cloud)
+MAX_CONCURRENT_REQUESTS = 4  # LLM calls in flight at once during batch processing
+SECTION_BATCH_SIZE = 8  # max resumes sent together in one LLM call
+MAX_REPLY_TOKENS = 8192  # Groq's per-request completion cap for the sectioning models
+# The sectioned JSON restates the resume, so a batch's reply is about as long as
+# its input; ~4 chars per token keeps the reply under MAX_REPLY_TOKENS with headroom
+MAX_BATCH_CHARS = 16000  # max resume text per batched call (~4k input tokens)
+MAX_RESUME_CHARS = 24000  # longer resumes are cut to this before sectioning (~6k input tokens)
+
+_rate_limit_lock = threading.Lock()
+_next_call_time = 0.0
+
+# Sectioning runs at temperature 0, so answers are cached on disk by
+# (model, prompt, cleaned text); set LLM_CACHE=0 to always call the LLM
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0"
+
+# Output schema shown to the LLM. It is embedded as compact JSON: the
+# indentation of a pretty-printed template costs prompt tokens on every call
+# without telling the model anything more.
+SECTION_SCHEMA = {
+    "summary": "2-3 sentence professional summary",
+    "experience": [
+        {
+            "title": "Job Title",
+            "company": "Company Name",
+            "dates": "Start - End",
+            "location": "City, State",
+            "responsibilities": ["responsibility 1", "responsibility 2"]
+        }
+    ],
+    "education": [
+        {
+            "degree": "Degree Type",
+            "field": "Field of Study",
+            "institution": "School Name",
+            "dates": "Year or Date Range",
+            "gpa": "GPA if mentioned"
+        }
+    ],
+    "skills": ["skill1", "skill2", "skill3"],
+    "certifications": ["certification1", "certification2"],
+    "other": ["other relevant info"]
+}
 
 SYSTEM_PROMPT = """You are a strict JSON generator. Extract resume information into EXACTLY this schema:
 
-{
-  "summary": "2-3 sentence professional summary",
-  "experience": [
-    {
-      "title": "Job Title",
-      "company": "Company Name",
-      "dates": "Start - End",
-      "location": "City, State",
-      "responsibilities": ["responsibility 1", "responsibility 2"]
-    }
-  ],
-  "education": [
-    {
-      "degree": "Degree Type",
-      "field": "Field of Study",
-      "institution": "School Name",
-      "dates": "Year or Date Range",
-      "gpa": "GPA if mentioned"
-    }
-  ],
-  "skills": ["skill1", "skill2", "skill3"],
-  "certifications": ["certification1", "certification2"],
-  "other": ["other relevant info"]
-}
+""" + orjson.dumps(SECTION_SCHEMA).decode() + """
 
 STRICT RULES:
 1. Return ONLY the JSON object - no markdown, no explanations, no extra text
@@ -89,118 +104,429 @@ STRICT RULES:
 7. Extract ALL experience and education entries from the resume
 8. Do NOT invent information - only extract what is explicitly stated"""
 
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+
+BATCH MODE:
+The input contains several resumes, each starting with a line "=== RESUME <n> ===".
+Return ONLY a JSON array with exactly one object per resume. Each object follows the schema above
+and also has a "resume" field holding the <n> from that resume's header line."""
+
+# Follow-up sent once when a reply isn't valid JSON
+REFORMAT_PROMPT = "Return only valid JSON for the previous answer, with no other text."
+
+# API errors worth retrying with backoff (429, 5xx, timeouts, dropped connections)
+TRANSIENT_API_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Cleaning / parsing regexes, compiled once at import
+WHITESPACE_RE = re.compile(r'\s+')
+CAMEL_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+FENCE_OPEN_RE = re.compile(r'^```json?\s*')
+FENCE_CLOSE_RE = re.compile(r'\s*```$')
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    text = text.encode("ascii", "ignore").decode()
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'([a-z])([A-Z])', r'\1. \2', text)
-    text = re.sub(r'\s+,', ',', text)
-    text = re.sub(r'\s+\.', '.', text)
+    # isascii() is a flag check, so already-ASCII text skips the re-encode
+    if not text.isascii():
+        text = text.encode("ascii", "ignore").decode()
+    text = WHITESPACE_RE.sub(' ', text)
+    text = CAMEL_BOUNDARY_RE.sub(r'\1. \2', text)
+    # Whitespace runs are single spaces by now, so plain replaces do the job
+    text = text.replace(' ,', ',').replace(' .', '.')
 
     return text.strip()
 
+
+def truncate_resume(text: str) -> str:
+    """
+    Cap resume text at MAX_RESUME_CHARS, cutting at a word boundary.
+    Keeps the beginning, where contact details and the summary usually are.
+    """
+    if len(text) <= MAX_RESUME_CHARS:
+        return text
+    cut = text.rfind(' ', 0, MAX_RESUME_CHARS + 1)
+    return text[:cut if cut > 0 else MAX_RESUME_CHARS]
+
+
+def get_current_route() -> tuple[str, str]:
+    """Get the current (provider, model) pair, read together so worker threads never mix them."""
+    with _provider_lock:
+        return current_provider, current_model
+
+
+def get_client(provider: str):
+    """Get the client for a provider."""
+    if provider == "ollama":
+        return get_ollama_client()
+    return get_groq_client()
+
+
 def get_current_client():
     """Get the appropriate client based on current provider."""
-    if current_provider == "ollama":
-        return ollama_client
-    return groq_client
+    return get_client(get_current_route()[0])
 
 
-def switch_to_ollama():
-    """Switch to Ollama local model."""
+def _use_ollama():
+    """Point sectioning at the local Ollama model (caller holds _provider_lock)."""
     global current_provider, current_model
     current_provider = "ollama"
     current_model = OLLAMA_MODEL
     print(f"\n  🖥️ Switching to Ollama local model ({OLLAMA_MODEL})...")
 
 
+def switch_to_ollama():
+    """Switch to Ollama local model."""
+    with _provider_lock:
+        _use_ollama()
+
+
+def fall_back_from(model: str):
+    """
+    Move one step down the fallback chain (Groq 70B → Groq 8B → Ollama) after
+    `model` failed. Several workers can hit the same limit at once, so this is
+    a no-op if another one has already moved past `model`.
+    """
+    global current_model
+    with _provider_lock:
+        if current_model != model:
+            return
+        if model == GROQ_PRIMARY:
+            current_model = GROQ_FALLBACK
+            print(f"\n  ⚠️ Daily limit hit on 70B, switching to 8B...")
+        elif model == GROQ_FALLBACK:
+            _use_ollama()
+
+
+# Sections the schema expects as arrays
+SECTION_LIST_KEYS = ("experience", "education", "skills", "certifications", "other")
+
+def normalize_sections(sections) -> dict:
+    """
+    Coerce an LLM answer to the section schema locally (missing keys, scalars
+    where arrays belong) instead of paying for another LLM call.
+    """
+    if not isinstance(sections, dict):
+        raise ValueError("LLM answer is not a JSON object")
+
+    summary = sections.get("summary")
+    if isinstance(summary, list):
+        summary = " ".join(str(s) for s in summary)
+    sections["summary"] = summary if isinstance(summary, str) else ""
+
+    for key in SECTION_LIST_KEYS:
+        value = sections.get(key)
+        if value is None or value == "":
+            sections[key] = []
+        elif not isinstance(value, list):
+            sections[key] = [value]
+    return sections
+
+
+def get_cached_sections(text: str):
+    """
+    Get the cached sections for a cleaned resume text under the current model,
+    whether a single or a batched call produced them, or None.
+    """
+    if not LLM_CACHE_ENABLED:
+        return None
+    model = get_current_route()[1]
+    for prompt in (SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT):
+        cached = cache_get("llm_sections", (model, prompt, text))
+        if cached is not None:
+            return cached
+    return None
+
+
+def put_cached_sections(text: str, sections: dict, model: str, prompt: str):
+    """Cache the sections for a cleaned resume text under the model and prompt that produced them."""
+    if LLM_CACHE_ENABLED:
+        cache_put("llm_sections", (model, prompt, text), sections)
+
+
 def section_with_llm(text: str, retries: int = 3) -> dict:
     """Call LLM to extract sections from resume text with retry logic and model fallback."""
-    global current_provider, current_model
+    text = truncate_resume(text)
+    cached = get_cached_sections(text)
+    if cached is not None:
+        return cached
+
+    answer, model = chat_json(SYSTEM_PROMPT, text, retries=retries, max_tokens=4000)
+    sections = normalize_sections(answer)
+    put_cached_sections(text, sections, model, SYSTEM_PROMPT)
+    return sections
+
+
+def section_with_llm_batch(texts: list[str], retries: int = 3) -> list[dict]:
+    """
+    Extract sections for several resumes, sending only the uncached ones
+    to the LLM in a single call.
+    """
+    texts = [truncate_resume(text) for text in texts]
+    results = [get_cached_sections(text) for text in texts]
+    missing = [i for i, sections in enumerate(results) if sections is None]
+
+    if missing:
+        fresh = _section_uncached_batch([texts[i] for i in missing], retries=retries)
+        for i, sections in zip(missing, fresh):
+            results[i] = sections
+    return results
+
+
+def _section_uncached_batch(texts: list[str], retries: int = 3) -> list[dict]:
+    """
+    Section several resumes with a single LLM call.
+    Falls back to one call per resume if the batched answer is unusable.
+    """
+    if len(texts) == 1:
+        return [section_with_llm(texts[0], retries=retries)]
+
+    user_content = "\n\n".join(
+        f"=== RESUME {i} ===\n{text}" for i, text in enumerate(texts, 1)
+    )
+
+    try:
+        results, model = chat_json(
+            BATCH_SYSTEM_PROMPT, user_content,
+            retries=retries, max_tokens=min(4000 * len(texts), MAX_REPLY_TOKENS)
+        )
+        results = order_batch_reply(results, len(texts))
+        if results is not None:
+            results = [normalize_sections(r) for r in results]
+            for text, sections in zip(texts, results):
+                put_cached_sections(text, sections, model, BATCH_SYSTEM_PROMPT)
+            return results
+        print(f"\n  Batch response malformed, sectioning {len(texts)} resumes one at a time...")
+    except Exception as e:
+        print(f"\n  Batch call failed ({str(e)[:50]}), sectioning {len(texts)} resumes one at a time...")
+
+    return [section_with_llm(text, retries=retries) for text in texts]
+
+
+def order_batch_reply(results, count: int):
+    """
+    Match a batched answer to its resumes by each object's "resume" index.
+    Returns the objects in resume order, or None unless the indices are exactly
+    1..count - a reordered, merged or split answer must not land on the wrong resume.
+    """
+    if not isinstance(results, list) or len(results) != count:
+        return None
+
+    by_index = {}
+    for result in results:
+        if not isinstance(result, dict):
+            return None
+        try:
+            by_index[int(result.pop("resume"))] = result
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    if sorted(by_index) != list(range(1, count + 1)):
+        return None
+    return [by_index[i] for i in range(1, count + 1)]
+
+
+def parse_json_reply(content: str):
+    """
+    Parse the LLM's JSON answer. If it wrapped the JSON in extra text, parse
+    the outermost {...} / [...] span instead of retrying the call.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        starts = [i for i in (content.find("{"), content.find("[")) if i != -1]
+        end = max(content.rfind("}"), content.rfind("]"))
+        if not starts or end <= min(starts):
+            raise
+        return orjson.loads(content[min(starts):end + 1])
+
+
+def chat_json(system_prompt: str, user_content: str, retries: int = 3, max_tokens: int = 4000):
+    """
+    Send one chat completion and parse its JSON answer, with retries and model fallback.
+    Returns (answer, model) - the model that actually answered, which can differ
+    from the one in use when the call started.
+    Only transient API errors are retried; a reply that isn't valid JSON gets one
+    reformat request, and any other error is raised straight away.
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content}
+    ]
+    reformat_requested = False
     last_error = None
+    attempt = 0
     
-    for attempt in range(retries):
+    while attempt < retries:
+        # Use one consistent snapshot per attempt; other workers may switch models meanwhile
+        provider, model = get_current_route()
         try:
-            client = get_current_client()
-            
-            response = client.chat.completions.create(
-                model=current_model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": text}
-                ],
+            wait_for_rate_limit(provider)
+            response = get_client(provider).chat.completions.create(
+                model=model,
+                messages=messages,
                 temperature=0,
-                max_tokens=4000
+                max_tokens=max_tokens
             )
-
-            content = response.choices[0].message.content
-            
-            # Handle empty response
-            if not content or not content.strip():
-                raise ValueError("Empty response from LLM")
-            
-            content = content.strip()
-            
-            # Remove markdown code blocks if present
-            if content.startswith("```"):
-                content = re.sub(r'^```json?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
-            
-            return json.loads(content)
-            
-        except Exception as e:
+        except TRANSIENT_API_ERRORS as e:
+            # Anything else (bad request, auth, unknown model) won't go away on retry
             error_str = str(e)
             last_error = e
+            attempt += 1
             
             # Only handle rate limits for Groq (cloud)
-            if current_provider == "groq":
-                # Check if it's a daily token limit error
-                if "429" in error_str and "tokens per day" in error_str.lower():
-                    if current_model == GROQ_PRIMARY:
-                        print(f"\n  ⚠️ Daily limit hit on 70B, switching to 8B...")
-                        current_model = GROQ_FALLBACK
+            if provider == "groq" and isinstance(e, RateLimitError):
+                # Daily token limit on 70B -> 8B; daily limit or any 429 on 8B -> Ollama
+                if "tokens per day" in error_str.lower() or model == GROQ_FALLBACK:
+                    fall_back_from(model)
+                    if model == GROQ_PRIMARY:
                         time.sleep(2)
-                        continue
-                    elif current_model == GROQ_FALLBACK:
-                        # Both Groq models exhausted, try Ollama
-                        switch_to_ollama()
-                        continue
-                
-                # Any 429 error on 8B model -> try Ollama
-                if "429" in error_str and current_model == GROQ_FALLBACK:
-                    switch_to_ollama()
                     continue
             
             # Ollama connection error - helpful message
-            if current_provider == "ollama" and "Connection" in error_str:
+            if provider == "ollama" and isinstance(e, APIConnectionError):
                 print(f"\n  ❌ Ollama not running! Start it with: ollama serve")
                 print(f"     Then pull the model: ollama pull {OLLAMA_MODEL}")
             
-            # For other errors, do normal retry with backoff
-            if attempt < retries - 1:
-                wait_time = (attempt + 1) * 2  # 2s, 4s, 6s
-                print(f"\n  Retry {attempt + 1}/{retries} after error: {str(e)[:50]}...")
-                time.sleep(wait_time)
+            # Back off exponentially, with jitter so parallel workers don't retry in lockstep
+            if attempt < retries:
+                print(f"\n  Retry {attempt}/{retries} after error: {error_str[:50]}...")
+                time.sleep(min(60, 2 ** attempt + random.random()))
             continue
+
+        content = (response.choices[0].message.content or "").strip()
+        
+        # Remove markdown code blocks if present
+        if content.startswith("```"):
+            content = FENCE_OPEN_RE.sub('', content)
+            content = FENCE_CLOSE_RE.sub('', content)
+        
+        try:
+            if not content:
+                raise ValueError("Empty response from LLM")
+            return parse_json_reply(content), model
+        except ValueError:
+            # A malformed answer isn't the server's fault - ask once for a reformat, then give up
+            if reformat_requested:
+                raise
+            reformat_requested = True
+            print(f"\n  Reply was not valid JSON, asking {model} to reformat it...")
+            if content:
+                messages = messages + [{"role": "assistant", "content": content}]
+            messages = messages + [{"role": "user", "content": REFORMAT_PROMPT}]
     
     # All retries failed
     raise last_error
 
-def process_all_txt():
+def write_manifest():
+    """Write the candidate manifest (id, file, mtime) for everything in OUTPUT_DIR."""
+    files = sorted(OUTPUT_DIR.glob("*.json"))
+    manifest = {
+        "dir_mtime_ns": OUTPUT_DIR.stat().st_mtime_ns,
+        "candidates": [
+            {"id": f.stem, "file": f.name, "mtime_ns": f.stat().st_mtime_ns}
+            for f in files
+        ]
+    }
+    
+    # Write to a temp file first so readers never see a half-written manifest
+    tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(manifest))
+    tmp_path.replace(MANIFEST_PATH)
+
+def wait_for_rate_limit(provider: str):
+    """Space out cloud API calls by DELAY_BETWEEN_CALLS, across all worker threads."""
+    global _next_call_time
+    if provider != "groq":
+        return
+    
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait_time = _next_call_time - now
+        _next_call_time = max(now, _next_call_time) + DELAY_BETWEEN_CALLS
+    
+    if wait_time > 0:
+        time.sleep(wait_time)
+
+def write_sections(file: Path, sections: dict) -> Path:
+    """Write the sectioned JSON output for one resume text file."""
+    output = {
+        "source_txt": file.name,
+        "sections": sections
+    }
+
+    out_path = OUTPUT_DIR / f"{file.stem}.json"
+    out_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    return out_path
+
+def section_batch(files: list[Path]) -> list[tuple]:
+    """Clean a batch of resume text files, section them in one LLM call and write their JSON.
+
+    Returns (file, error) pairs; error is None on success.
+    """
+    # clean_text keeps only ASCII, so decode straight to ASCII instead of decoding
+    # UTF-8 and re-encoding (dropping the non-ASCII bytes gives the same text)
+    texts = [
+        clean_text(file.read_bytes().decode("ascii", "ignore"))
+        for file in files
+    ]
+
+    try:
+        all_sections = section_with_llm_batch(texts)
+    except Exception as e:
+        return [(file, e) for file in files]
+
+    results = []
+    for file, sections in zip(files, all_sections):
+        try:
+            write_sections(file, sections)
+            results.append((file, None))
+        except Exception as e:
+            results.append((file, e))
+    return results
+
+def make_batches(files: list[Path]) -> list[list[Path]]:
+    """
+    Group files into batches of at most SECTION_BATCH_SIZE resumes and
+    MAX_BATCH_CHARS of text (file size bounds the cleaned text length),
+    so long resumes don't push a batched prompt past the model's limits.
+    """
+    batches = []
+    batch, batch_chars = [], 0
+    for file in files:
+        size = file.stat().st_size
+        if batch and (len(batch) >= SECTION_BATCH_SIZE or batch_chars + size > MAX_BATCH_CHARS):
+            batches.append(batch)
+            batch, batch_chars = [], 0
+        batch.append(file)
+        batch_chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+def process_all_txt(progress_callback=None):
+    """
+    Section every resume text file whose JSON output is missing or older than the text.
+    progress_callback: Optional function(current, total) called as each resume finishes
+    """
     global current_provider, current_model
     
     # Reset to Groq primary at start
-    current_provider = "groq"
-    current_model = GROQ_PRIMARY
+    with _provider_lock:
+        current_provider = "groq"
+        current_model = GROQ_PRIMARY
     
     files = list(INPUT_DIR.glob("*.txt"))
+    # stem -> mtime of its JSON output
     done_files = {
-        f.stem for f in OUTPUT_DIR.glob("*.json")
+        f.stem: f.stat().st_mtime_ns for f in OUTPUT_DIR.glob("*.json")
     }
     
-    pending_files = [f for f in files if f.stem not in done_files]
+    # Re-section edited texts too; unchanged cleaned text is an LLM cache hit anyway
+    pending_files = [
+        f for f in files
+        if f.stem not in done_files or f.stat().st_mtime_ns > done_files[f.stem]
+    ]
 
     print(f"Found {len(files)} resume files")
     print(f"Already processed: {len(done_files)}")
@@ -210,37 +536,31 @@ def process_all_txt():
     
     if not pending_files:
         print("All files already processed!")
+        write_manifest()
         return
 
-    for i, file in enumerate(pending_files):
-        # Show current provider if it changed
-        provider_tag = "🖥️" if current_provider == "ollama" else "☁️"
-        print(f"[{i+1}/{len(pending_files)}] {provider_tag} Processing {file.name}...", end=" ")
-        
-        try:
-            raw = file.read_text(encoding="utf-8", errors="ignore")
-            cleaned = clean_text(raw)
+    batches = make_batches(pending_files)
+    done = 0
 
-            sections = section_with_llm(cleaned)
-
-            output = {
-                "source_txt": file.name,
-                "sections": sections
-            }
-
-            out_path = OUTPUT_DIR / f"{file.stem}.json"
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            
-            print("✓")
+    # LLM calls are network-bound, so overlap several batches on threads
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = [executor.submit(section_batch, batch) for batch in batches]
+        
+        for future in as_completed(futures):
+            # Show current provider if it changed
+            provider_tag = "🖥️" if get_current_route()[0] == "ollama" else "☁️"
             
-            # Only delay for cloud APIs
-            if current_provider == "groq" and i < len(pending_files) - 1:
-                time.sleep(DELAY_BETWEEN_CALLS)
-
-        except Exception as e:
-            print(f"✗ Error: {e}")
+            for file, error in future.result():
+                done += 1
+                if error is None:
+                    print(f"[{done}/{len(pending_files)}] {provider_tag} {file.name} ✓")
+                else:
+                    print(f"[{done}/{len(pending_files)}] {provider_tag} {file.name} ✗ Error: {error}")
+                
+                if progress_callback:
+                    progress_callback(done, len(pending_files))
 
+    write_manifest()
     print("Done. All resumes processed.")
 
 if __name__ == "__main__":
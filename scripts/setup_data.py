@@ -1,6 +1,8 @@
 import os
 import zipfile
-from pathlib import Path
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 
 # Root project directory
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -25,16 +27,35 @@ if not ZIP_PATH.exists():
         f"Dataset zip not found at {ZIP_PATH}\n"
         )
 
+def extract_members(names: list[str]):
+    """Extract some zip members using this thread's own ZipFile handle."""
+    with zipfile.ZipFile(ZIP_PATH, "r") as zip_ref:
+        for name in names:
+            zip_ref.extract(name, DATA_RAW)
+
 # Extract dataset
 with zipfile.ZipFile(ZIP_PATH, "r") as zip_ref:
-    zip_ref.extractall(DATA_RAW)
+    members = zip_ref.infolist()
+
+# Create folders up front so worker threads never race to create the same one
+# (unsafe parts are dropped the same way ZipFile.extract drops them)
+for info in members:
+    parts = [p for p in PurePosixPath(info.filename).parts if p not in ("", ".", "..", "/")]
+    folder = parts if info.is_dir() else parts[:-1]
+    DATA_RAW.joinpath(*folder).mkdir(parents=True, exist_ok=True)
+
+# zlib releases the GIL while inflating, so members extract in parallel on threads
+member_files = [info.filename for info in members if not info.is_dir()]
+workers = max(1, min(os.cpu_count() or 1, 8, len(member_files)))
+with ThreadPoolExecutor(max_workers=workers) as executor:
+    list(executor.map(extract_members, [member_files[i::workers] for i in range(workers)]))
 
 print(f"Dataset extracted to: {DATA_RAW}")
 
-# Show sample files
-all_files = list(DATA_RAW.rglob("*.*"))
-print(f"Total files found: {len(all_files)}")
+# Show sample files (the count comes from the archive, so the extracted
+# tree is only walked as far as the first 10 files)
+print(f"Total files extracted: {len(member_files)}")
 print("Sample files:")
-for f in all_files[:10]:
+for f in islice((p for p in DATA_RAW.rglob("*.*") if p.is_file()), 10):
     print("-", f.relative_to(DATA_RAW))
     
\ No newline at end of file